@@ -272,16 +272,7 @@ class BraketService:
         """
         try:
             # Convert circuit if needed
-            braket_circuit = None
-            if isinstance(circuit, QuantumCircuit):
-                qiskit_circuit = self.create_qiskit_circuit(circuit)
-                braket_circuit = self.convert_to_braket_circuit(qiskit_circuit)
-            elif isinstance(circuit, QiskitCircuit):
-                braket_circuit = self.convert_to_braket_circuit(circuit)
-            elif isinstance(circuit, BraketCircuit):
-                braket_circuit = circuit
-            else:
-                raise TaskExecutionError(f"Unsupported circuit type: {type(circuit)}")
+            braket_circuit = self._to_braket_circuit(circuit)
             
             # Create the device
             device = AwsDevice(device_arn)
@@ -298,6 +289,59 @@ class BraketService:
             logger.exception(f"Error running quantum task: {str(e)}")
             raise TaskExecutionError(f"Error running quantum task: {str(e)}")
 
+    def run_quantum_task_batch(
+        self,
+        circuits: List[Union[QiskitCircuit, BraketCircuit, QuantumCircuit]],
+        device_arn: str,
+        shots: int = 1000,
+        max_parallel: Optional[int] = None,
+        s3_bucket: Optional[str] = None,
+        s3_prefix: Optional[str] = None,
+    ) -> List[str]:
+        """Run several circuits as one Amazon Braket task batch.
+
+        Args:
+            circuits: Quantum circuits to run (Qiskit, Braket, or circuit definitions)
+            device_arn: ARN of the device to run the tasks on
+            shots: Number of shots to run per circuit
+            max_parallel: Maximum number of tasks to run concurrently (optional)
+            s3_bucket: S3 bucket for storing results (optional)
+            s3_prefix: S3 prefix for storing results (optional)
+
+        Returns:
+            List[str]: Task IDs of the created quantum tasks, in circuit order
+
+        Raises:
+            TaskExecutionError: If there is an error executing the batch
+        """
+        try:
+            braket_circuits = [self._to_braket_circuit(circuit) for circuit in circuits]
+            
+            device = AwsDevice(device_arn)
+            batch_kwargs = {"max_parallel": max_parallel} if max_parallel else {}
+            batch = device.run_batch(
+                braket_circuits,
+                shots=shots,
+                s3_destination_folder=(s3_bucket, s3_prefix) if s3_bucket and s3_prefix else None,
+                **batch_kwargs,
+            )
+            
+            return [task.id for task in batch.tasks]
+        except Exception as e:
+            logger.exception(f"Error running quantum task batch: {str(e)}")
+            raise TaskExecutionError(f"Error running quantum task batch: {str(e)}")
+
+    def _to_braket_circuit(self, circuit: Union[QiskitCircuit, BraketCircuit, QuantumCircuit]) -> BraketCircuit:
+        """Convert a supported circuit representation to a Braket circuit."""
+        if isinstance(circuit, QuantumCircuit):
+            qiskit_circuit = self.create_qiskit_circuit(circuit)
+            return self.convert_to_braket_circuit(qiskit_circuit)
+        elif isinstance(circuit, QiskitCircuit):
+            return self.convert_to_braket_circuit(circuit)
+        elif isinstance(circuit, BraketCircuit):
+            return circuit
+        raise TaskExecutionError(f"Unsupported circuit type: {type(circuit)}")
+
     def get_task_result(self, task_id: str) -> TaskResult:
         """Get the result of a quantum task.
 
@@ -37,7 +37,7 @@ from .strands_coordinator import StrandsCoordinator
 from .strands_dft_agent import StrandsDFTAgent
 from .strands_structure_agent import StrandsStructureAgent
 from .strands_agentic_loop import StrandsAgenticLoop
-from utils.braket_integration import braket_integration
+from utils.braket_integration import get_braket_integration
 from utils.mcp_tools_wrapper import initialize_mcp_wrapper, get_mcp_wrapper
 
 class StrandsSupervisorAgent(BaseAgent):
@@ -971,7 +971,7 @@ Direct
     
     def _handle_braket_query(self, query: str) -> dict:
         """Handle Braket-specific queries using Braket MCP integration"""
-        if not braket_integration.is_available():
+        if not get_braket_integration().is_available():
             return {
                 "status": "error", 
                 "message": "Braket MCP not available. Install dependencies: pip install amazon-braket-sdk qiskit-braket-provider fastmcp"
@@ -985,7 +985,7 @@ Direct
                 logger.info("⚙️ STRANDS: Creating pure VQE circuit (no Materials Project data)")
                 # Use simple material data for pure algorithm
                 material_data = {'formula': 'H2', 'band_gap': 8.0, 'formation_energy': 0.0}
-                result = braket_integration.create_vqe_circuit(material_data)
+                result = get_braket_integration().create_vqe_circuit(material_data)
                 return {
                     "status": "success",
                     "braket_data": result,
@@ -997,7 +997,7 @@ Direct
             # Bell pair circuits
             elif 'bell' in query_lower and ('pair' in query_lower or 'state' in query_lower or 'circuit' in query_lower):
                 logger.info("🔔 STRANDS: Creating Bell pair circuit with Braket MCP")
-                result = braket_integration.create_bell_pair_circuit()
+                result = get_braket_integration().create_bell_pair_circuit()
                 return {
                     "status": "success",
                     "braket_data": result,
@@ -1013,7 +1013,7 @@ Direct
                 num_qubits = int(qubit_match.group(1)) if qubit_match else 3
                 
                 logger.info(f"🌀 STRANDS: Creating {num_qubits}-qubit GHZ circuit with Braket MCP")
-                result = braket_integration.create_ghz_circuit(num_qubits)
+                result = get_braket_integration().create_ghz_circuit(num_qubits)
                 return {
                     "status": "success",
                     "braket_data": result,
@@ -1025,7 +1025,7 @@ Direct
             # Device listing
             elif 'device' in query_lower and ('list' in query_lower or 'available' in query_lower or 'status' in query_lower):
                 logger.info("🖥️ STRANDS: Listing Braket devices")
-                result = braket_integration.list_braket_devices()
+                result = get_braket_integration().list_braket_devices()
                 return {
                     "status": "success",
                     "braket_data": result,
@@ -1040,7 +1040,7 @@ Direct
                 mp_materials = ['graphene', 'materials project', 'mp-', 'tio2', 'sio2', 'diamond', 'silicon']
                 if not any(material in query_lower for material in mp_materials):
                     logger.info("🔧 STRANDS: Creating simple circuit with Braket MCP")
-                    result = braket_integration.create_bell_pair_circuit()
+                    result = get_braket_integration().create_bell_pair_circuit()
                     return {
                         "status": "success",
                         "braket_data": result,
@@ -1057,7 +1057,7 @@ Direct
             # General Braket status
             else:
                 logger.info("📊 STRANDS: Getting Braket status and capabilities")
-                result = braket_integration.get_braket_status()
+                result = get_braket_integration().get_braket_status()
                 return {
                     "status": "success",
                     "braket_data": result,
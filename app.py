@@ -27,7 +27,7 @@ from models.claude_sonnet_model import ClaudeSonnetModel
 from utils.enhanced_mcp_client import EnhancedMCPAgent
 from utils.secrets_manager import get_mp_api_key
 from utils.logging_display import setup_logging_display, display_mcp_logs
-from utils.braket_integration import braket_integration
+from utils.braket_integration import get_braket_integration
 from utils.debug_logger import get_debug_logger, simulate_mcp_processing_logs
 
 from demo_mode import get_demo_response
@@ -580,7 +580,7 @@ def main():
         
         # Braket Integration Status
         st.markdown("#### ⚛️ Amazon Braket Integration")
-        if braket_integration.is_available():
+        if get_braket_integration().is_available():
             st.success("✅ Braket MCP Server Available")
             
             # Braket mode toggle
@@ -1008,18 +1008,18 @@ print("Sample ansatz created with", ansatz.num_parameters, "parameters")'''
                         if 'ghz' in query.lower():
                             qubit_match = re.search(r'(\d{1,3})\s*qubit', query.lower())
                             num_qubits = int(qubit_match.group(1)) if qubit_match else 3
-                            braket_data = braket_integration.create_ghz_circuit(num_qubits)
+                            braket_data = get_braket_integration().create_ghz_circuit(num_qubits)
                         elif 'bell' in query.lower():
-                            braket_data = braket_integration.create_bell_pair_circuit()
+                            braket_data = get_braket_integration().create_bell_pair_circuit()
                             if show_debug and debug_placeholder:
                                 debug_placeholder.info(f"🔍 **Braket MCP Call:** Bell pair circuit")
                         elif 'device' in query.lower() and ('available' in query.lower() or 'status' in query.lower() or 'list' in query.lower()):
-                            braket_data = braket_integration.list_braket_devices()
+                            braket_data = get_braket_integration().list_braket_devices()
                             if show_debug and debug_placeholder:
                                 debug_placeholder.info(f"🔍 **Braket MCP Call:** Device list")
                         else:
                             # Default to Bell pair for general circuit requests
-                            braket_data = braket_integration.create_bell_pair_circuit()
+                            braket_data = get_braket_integration().create_bell_pair_circuit()
                             if show_debug and debug_placeholder:
                                 debug_placeholder.info(f"🔍 **Braket MCP Call:** Default Bell pair")
                         
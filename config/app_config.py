@@ -2,6 +2,7 @@
 Application configuration with environment variable support
 """
 import os
+from functools import lru_cache
 
 class AppConfig:
     """Centralized configuration with environment variable fallbacks"""
@@ -23,4 +24,10 @@ class AppConfig:
     # Retry Configuration
     DEFAULT_MAX_RETRIES = int(os.getenv('DEFAULT_MAX_RETRIES', '2'))
     RETRY_BASE_DELAY = float(os.getenv('RETRY_BASE_DELAY', '1.0'))
-    RETRY_MAX_DELAY = int(os.getenv('RETRY_MAX_DELAY', '10'))
\ No newline at end of file
+    RETRY_MAX_DELAY = int(os.getenv('RETRY_MAX_DELAY', '10'))
+
+@lru_cache(maxsize=None)
+def cognito_client(region: str):
+    """One Cognito client per region, shared by every auth handler across reruns"""
+    import boto3
+    return boto3.client('cognito-idp', region_name=region)
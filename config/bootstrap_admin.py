@@ -3,11 +3,11 @@ Bootstrap Admin System - First-time setup for platform deployer
 Allows the deployer to make themselves admin on first login
 """
 
-import boto3
 import streamlit as st
 import os
 import logging
 from botocore.exceptions import ClientError
+from config.app_config import cognito_client
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +19,7 @@ class BootstrapAdmin:
         self.region = os.getenv('COGNITO_REGION', os.getenv('AWS_DEFAULT_REGION', 'us-east-1'))
         
         if self.pool_id:
-            self.cognito = boto3.client('cognito-idp', region_name=self.region)
+            self.cognito = cognito_client(self.region)
         else:
             self.cognito = None
     
@@ -4,7 +4,6 @@ Handles both signup and login with proper email verification
 """
 
 import os
-import boto3
 import streamlit as st
 import hmac
 import hashlib
@@ -12,6 +11,7 @@ import base64
 import time
 import logging
 from botocore.exceptions import ClientError
+from config.app_config import cognito_client
 
 try:
     import jwt
@@ -31,7 +31,7 @@ class CustomCognitoAuth:
         self.region = os.getenv('COGNITO_REGION', os.getenv('AWS_DEFAULT_REGION', 'us-east-1'))
         
         if self.pool_id and self.app_client_id:
-            self.cognito = boto3.client('cognito-idp', region_name=self.region)
+            self.cognito = cognito_client(self.region)
         else:
             self.cognito = None
     
@@ -11,6 +11,9 @@ import subprocess
 import sys
 from pathlib import Path
 
+# Resolved once; proves the EB CLI exists without spawning it just to print a version
+_EB_PATH = shutil.which('eb')
+
 def create_deployment_package():
     """Create deployment package with all fixes"""
     
@@ -181,16 +184,15 @@ def deploy_to_eb():
     
     try:
         # Check if EB CLI is available
-        result = subprocess.run(['eb', '--version'], capture_output=True, text=True)
-        if result.returncode != 0:
+        if not _EB_PATH:
             print("❌ EB CLI not found. Install with: pip install awsebcli")
             return False
         
-        print(f"✅ EB CLI version: {result.stdout.strip()}")
+        print(f"✅ EB CLI found: {_EB_PATH}")
         
         # Get available environments
         print("\n📋 Getting available environments...")
-        result = subprocess.run(['eb', 'list'], capture_output=True, text=True)
+        result = subprocess.run([_EB_PATH, 'list'], capture_output=True, text=True)
         if result.returncode == 0:
             print("Available environments:")
             print(result.stdout)
@@ -199,13 +201,13 @@ def deploy_to_eb():
             env_name = input("\n🎯 Enter environment name to deploy to (or press Enter for default): ").strip()
             
             if env_name:
-                deploy_cmd = ['eb', 'deploy', env_name]
+                deploy_cmd = [_EB_PATH, 'deploy', env_name]
                 print(f"🚀 Running eb deploy {env_name}...")
             else:
-                deploy_cmd = ['eb', 'deploy']
+                deploy_cmd = [_EB_PATH, 'deploy']
                 print("🚀 Running eb deploy...")
         else:
-            deploy_cmd = ['eb', 'deploy']
+            deploy_cmd = [_EB_PATH, 'deploy']
             print("🚀 Running eb deploy...")
         
         # Deploy
@@ -221,11 +223,14 @@ def deploy_to_eb():
         
         # Get status
         print("\n📊 Getting deployment status...")
-        result = subprocess.run(['eb', 'status'], capture_output=True, text=True)
+        result = subprocess.run([_EB_PATH, 'status'], capture_output=True, text=True)
         print(result.stdout)
         
         return True
         
+    except (FileNotFoundError, PermissionError) as e:
+        print(f"❌ Could not run EB CLI at {_EB_PATH}: {e}")
+        return False
     except Exception as e:
         print(f"❌ Deployment error: {e}")
         return False
@@ -8,9 +8,13 @@ import boto3
 import json
 import time
 import os
+import re
 from botocore.exceptions import ClientError, NoCredentialsError
 from boto3.session import Session
 
+# Case-insensitive match for this app's EB environments, without lowercasing every name
+QUANTUM_ENV_MATCH = re.compile(r'quantum-matter', re.IGNORECASE).search
+
 def create_waf_web_acl():
     """Create AWS WAF Web ACL with Core Protections and rate limiting"""
     # WAF for CloudFront MUST be in us-east-1 (global service)
@@ -187,23 +191,34 @@ def get_eb_domain():
     eb = boto3.client('elasticbeanstalk')
     
     try:
-        # List environments
-        environments = eb.describe_environments()
+        # List environments (paginated, so collect every page)
+        all_envs = []
+        # Deleted environments have no CNAME to put behind CloudFront; EB_* names narrow the search
+        env_filters = {'IncludeDeleted': False}
+        if os.getenv('EB_APPLICATION_NAME'):
+            env_filters['ApplicationName'] = os.getenv('EB_APPLICATION_NAME')
+        if os.getenv('EB_ENVIRONMENT_NAME'):
+            env_filters['EnvironmentNames'] = [os.getenv('EB_ENVIRONMENT_NAME')]
+        for page in eb.get_paginator('describe_environments').paginate(**env_filters):
+            all_envs.extend(page['Environments'])
         
-        if not environments['Environments']:
+        if not all_envs:
             print("❌ No Elastic Beanstalk environments found")
             return None
         
-        # Find quantum-matter environments
-        quantum_envs = [env for env in environments['Environments'] if 'quantum-matter' in env['EnvironmentName'].lower()]
+        # Find quantum-matter environments, stopping after two matches to detect the single-env case
+        matches = (env for env in all_envs if QUANTUM_ENV_MATCH(env['EnvironmentName']))
+        first_match = next(matches, None)
+        second_match = next(matches, None)
         
-        if quantum_envs:
-            if len(quantum_envs) == 1:
+        if first_match:
+            if second_match is None:
                 # Only one quantum-matter environment found
-                env = quantum_envs[0]
+                env = first_match
                 print(f"✅ Found EB environment: {env['EnvironmentName']}")
                 return env['CNAME']
             else:
+                quantum_envs = [first_match, second_match, *matches]
                 # Multiple quantum-matter environments, let user choose
                 print("📋 Multiple Quantum Matter environments found:")
                 for i, env in enumerate(quantum_envs, 1):
@@ -232,7 +247,7 @@ def get_eb_domain():
         
         # If no quantum-matter environments, show all available
         print("📋 No 'quantum-matter' environments found. Available environments:")
-        for i, env in enumerate(environments['Environments'], 1):
+        for i, env in enumerate(all_envs, 1):
             status = env.get('Status', 'Unknown')
             health = env.get('Health', 'Unknown')
             print(f"  {i}. {env['EnvironmentName']} ({status}, {health})")
@@ -240,11 +255,11 @@ def get_eb_domain():
         # Ask user to select from all environments
         while True:
             try:
-                choice = input(f"\n🎯 Select environment (1-{len(environments['Environments'])}): ").strip()
+                choice = input(f"\n🎯 Select environment (1-{len(all_envs)}): ").strip()
                 if choice:
                     idx = int(choice) - 1
-                    if 0 <= idx < len(environments['Environments']):
-                        selected_env = environments['Environments'][idx]
+                    if 0 <= idx < len(all_envs):
+                        selected_env = all_envs[idx]
                         print(f"✅ Selected: {selected_env['EnvironmentName']}")
                         return selected_env['CNAME']
                     else:
@@ -19,6 +19,25 @@ mcp = FastMCP("enhanced-mcp-materials")
 # In-memory structure storage (simplified version of the official server's approach)
 structure_storage = {}
 
+# When the client sets MCP_IMAGE_DIR, plots are handed over as files instead of inline base64
+IMAGE_DIR = os.environ.get("MCP_IMAGE_DIR")
+
+def png_content(img_bytes: bytes) -> ImageContent:
+    """Return a PNG as a file in IMAGE_DIR when possible, otherwise as inline base64"""
+    if IMAGE_DIR:
+        import tempfile
+        path = None
+        try:
+            with tempfile.NamedTemporaryFile(delete=False, dir=IMAGE_DIR, prefix="mcp-plot-", suffix=".png") as image_file:
+                path = image_file.name
+                image_file.write(img_bytes)
+            return ImageContent(type="image", data="", mimeType="image/png", path=path)
+        except Exception as e:
+            logger.warning(f"⚠️ AWS PLOT_STRUCTURE: Could not hand over image file ({e}), sending inline")
+            if path and os.path.exists(path):
+                os.unlink(path)
+    return ImageContent(type="image", data=base64.b64encode(img_bytes).decode('utf-8'), mimeType="image/png")
+
 def ensure_structure_object(structure_data):
     """Ensure we have a proper pymatgen Structure object"""
     if isinstance(structure_data, dict):
@@ -420,7 +439,7 @@ def plot_structure(structure_uri: str, duplication: List[int] = [1, 1, 1]) -> Li
         duplication: The duplication of the structure along a, b, c axes
     
     Returns:
-        PNG image of the structure
+        PNG image of the structure (always the first content item)
     """
     structure_id = structure_uri.replace("structure://", "")
     
@@ -489,10 +508,9 @@ def plot_structure(structure_uri: str, duplication: List[int] = [1, 1, 1]) -> Li
             
             # Convert plotly figure to PNG
             img_bytes = pio.to_image(fig, format='png', width=800, height=600, scale=2)
-            img_base64 = base64.b64encode(img_bytes).decode('utf-8')
             
-            logger.info(f"✅ AWS PLOT_STRUCTURE: Successfully created plotly visualization ({len(img_base64)} chars)")
-            return [ImageContent(type="image", data=img_base64, mimeType="image/png")]
+            logger.info(f"✅ AWS PLOT_STRUCTURE: Successfully created plotly visualization ({len(img_bytes)} bytes)")
+            return [png_content(img_bytes)]
             
         except Exception as plotly_error:
             logger.warning(f"⚠️ AWS PLOT_STRUCTURE: Simple plotly failed ({plotly_error}), falling back to matplotlib")
@@ -536,15 +554,14 @@ def plot_structure(structure_uri: str, duplication: List[int] = [1, 1, 1]) -> Li
         ax.set_title(title)
         ax.legend()
         
-        # Convert to base64 with proper resource management
+        # Render to PNG bytes with proper resource management
         with BytesIO() as buffer:
             plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-            buffer.seek(0)
-            img_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
+            img_bytes = buffer.getvalue()
         plt.close()
         
-        logger.info(f"✅ AWS PLOT_STRUCTURE: Matplotlib fallback successful ({len(img_base64)} chars)")
-        return [ImageContent(type="image", data=img_base64, mimeType="image/png")]
+        logger.info(f"✅ AWS PLOT_STRUCTURE: Matplotlib fallback successful ({len(img_bytes)} bytes)")
+        return [png_content(img_bytes)]
         
     except Exception as e:
         logger.error(f"❌ AWS PLOT_STRUCTURE: Both plotly and matplotlib failed: {e}")
@@ -1,15 +1,33 @@
 import os
 import re
 import json
+import time
+import random
 import logging
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+# Bedrock error codes botocore does not retry, so _invoke_with_retry backs off on them itself
+RETRYABLE_BEDROCK_ERRORS = {"ModelNotReadyException"}
+BEDROCK_MAX_ATTEMPTS = 5
+
+# botocore's adaptive mode retries throttling/5xx with client-side rate limiting; that is the
+# only retry budget for throttled calls
+BEDROCK_CLIENT_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": BEDROCK_MAX_ATTEMPTS})
+
 class BaseQiskitGenerator(ABC):
     """Base class for all LLM-powered Qiskit generators"""
     
+    # In-flight LLM calls shared by all generators so identical concurrent prompts hit Bedrock once
+    _inflight: Dict[Tuple, Future] = {}
+    _inflight_lock = threading.Lock()
+    
     def __init__(self, mp_agent: Optional[Any] = None, region_name: str = "us-east-1"):
         self.mp_agent = mp_agent
         self.region_name = region_name
@@ -47,6 +65,71 @@ class BaseQiskitGenerator(ABC):
         """Call the LLM with the given prompt"""
         pass
     
+    @staticmethod
+    def _make_body_builder(defaults: Dict[str, Any]):
+        """Specialize a chat request-body builder for a fixed set of sampling params.
+        
+        The message envelope never changes between calls, so it is serialized once
+        here and only the prompt and per-call sampling values are encoded at call time.
+        """
+        prefix = '{"messages": [{"role": "user", "content": '
+        
+        def build_body(prompt: str, **kwargs) -> str:
+            params = {key: kwargs.get(key, value) for key, value in defaults.items()}
+            return prefix + json.dumps(prompt) + "}], " + json.dumps(params)[1:]
+        
+        return build_body
+    
+    def _call_llm_coalesced(self, prompt: str, **kwargs) -> str:
+        """Call the LLM, sharing the result with any identical request already in flight"""
+        key = (type(self).__name__, self.model_id, prompt, tuple(sorted(kwargs.items())))
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not owner:
+            logger.info(f"🔁 BASE MODEL: Joining in-flight {self.model_name} request")
+            return future.result()
+        
+        try:
+            result = self._call_llm(prompt, **kwargs)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _prime_connection(self, client, model_id: str, body: str):
+        """Fire a one-token request in the background so the first real call reuses a warm connection"""
+        def prime():
+            try:
+                client.invoke_model(modelId=model_id, body=body, contentType="application/json")
+                logger.debug(f"{self.model_name} connection primed")
+            except Exception as e:
+                # Priming is best-effort; real calls surface their own errors
+                logger.debug(f"{self.model_name} priming call failed: {e}")
+        
+        threading.Thread(target=prime, daemon=True).start()
+    
+    def _invoke_with_retry(self, client, **kwargs):
+        """Call invoke_model, backing off with jitter while the model is not ready"""
+        for attempt in range(BEDROCK_MAX_ATTEMPTS):
+            try:
+                return client.invoke_model(**kwargs)
+            except ClientError as e:
+                error_code = e.response["Error"]["Code"]
+                if error_code not in RETRYABLE_BEDROCK_ERRORS or attempt == BEDROCK_MAX_ATTEMPTS - 1:
+                    raise
+                delay = min(20, 2 ** attempt) + random.random()
+                logger.warning(f"{self.model_name} {error_code}, retrying in {delay:.1f}s (attempt {attempt + 1})")
+                time.sleep(delay)
+    
     def _sanitize_ident(self, text: str) -> str:
         """Sanitize text to create valid Python identifiers"""
         s = re.sub(r'[^0-9a-zA-Z_]+', '_', text)
@@ -1011,7 +1094,7 @@ print(f"Toy Hamiltonian for {formula}: {{len(qubit_op)}} Pauli terms, {{ansatz.n
             prompt = self._create_enhanced_prompt(query, base_code, intent, mp_data, show_debug, braket_mode)
             
             # Call LLM
-            llm_response = self._call_llm(
+            llm_response = self._call_llm_coalesced(
                 prompt, 
                 temperature=temperature, 
                 max_tokens=max_tokens, 
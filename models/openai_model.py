@@ -3,7 +3,7 @@ import logging
 from typing import Dict, Any, Optional
 import boto3
 from botocore.exceptions import ClientError
-from .base_model import BaseQiskitGenerator
+from .base_model import BaseQiskitGenerator, BEDROCK_CLIENT_CONFIG
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +20,10 @@ class OpenAIModel(BaseQiskitGenerator):
             raise ImportError("boto3 not available")
         
         self.model_id = model_id
-        self.bedrock_client = boto3.client("bedrock-runtime", region_name=self.region_name)
+        self.bedrock_client = boto3.client("bedrock-runtime", region_name=self.region_name, config=BEDROCK_CLIENT_CONFIG)
+        self._build_body = self._make_body_builder({"temperature": 0.7, "max_tokens": 1000, "top_p": 0.9})
         self.llm_enabled = True
+        self._prime_connection(self.bedrock_client, model_id, self._build_body("ping", max_tokens=1))
         logger.info(f"OpenAI GPT OSS enabled in {self.region_name}")
     
     def _call_llm(self, prompt: str, **kwargs) -> str:
@@ -30,19 +32,13 @@ class OpenAIModel(BaseQiskitGenerator):
             raise RuntimeError("OpenAI GPT OSS not initialized")
         
         # OpenAI GPT OSS request format - prompt already contains system instructions
-        request_body = {
-            "messages": [
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": kwargs.get("temperature", 0.7),
-            "max_tokens": kwargs.get("max_tokens", 1000),
-            "top_p": kwargs.get("top_p", 0.9)
-        }
+        request_body = self._build_body(prompt, **kwargs)
         
         try:
-            response = self.bedrock_client.invoke_model(
+            response = self._invoke_with_retry(
+                self.bedrock_client,
                 modelId=self.model_id,
-                body=json.dumps(request_body),
+                body=request_body,
                 contentType="application/json"
             )
             
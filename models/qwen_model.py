@@ -3,7 +3,7 @@ import logging
 from typing import Dict, Any, Optional
 import boto3
 from botocore.exceptions import ClientError
-from .base_model import BaseQiskitGenerator
+from .base_model import BaseQiskitGenerator, BEDROCK_CLIENT_CONFIG
 
 logger = logging.getLogger(__name__)
 
@@ -22,14 +22,16 @@ class QwenModel(BaseQiskitGenerator):
         
         # Use session pattern from tested notebook
         session = boto3.Session(region_name=self.region_name)
-        client = session.client("bedrock-runtime")
+        client = session.client("bedrock-runtime", config=BEDROCK_CLIENT_CONFIG)
         
         # Store as dict like in notebook (critical for Qwen)
         self.bedrock_client_dict = {
             "client": client,
             "model_id": model_id
         }
+        self._build_body = self._make_body_builder({"temperature": 0.15, "max_tokens": 2000})
         self.llm_enabled = True
+        self._prime_connection(client, model_id, self._build_body("ping", max_tokens=1))
         logger.info(f"Qwen 3-32B enabled in {self.region_name}")
     
     def _call_llm(self, prompt: str, **kwargs) -> str:
@@ -38,21 +40,16 @@ class QwenModel(BaseQiskitGenerator):
             raise RuntimeError("Qwen 3-32B not initialized")
         
         # Qwen-specific message format - prompt already contains system instructions
-        body = {
-            "messages": [
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": kwargs.get("temperature", 0.15),
-            "max_tokens": kwargs.get("max_tokens", 2000)
-        }
+        body = self._build_body(prompt, **kwargs)
         
         try:
             # Critical: modelId as top-level parameter (NOT in body) for Qwen
-            response = self.bedrock_client_dict["client"].invoke_model(
+            response = self._invoke_with_retry(
+                self.bedrock_client_dict["client"],
                 modelId=self.bedrock_client_dict["model_id"],
                 contentType="application/json",
                 accept="application/json",
-                body=json.dumps(body)
+                body=body
             )
         
             # Parse Qwen response format
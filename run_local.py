@@ -4,7 +4,7 @@ Local development runner with auth bypass
 """
 import os
 import sys
-import subprocess
+import socket
 
 # Set demo credentials for local testing (only if not already set)
 if not os.environ.get('DEMO_USERNAME'):
@@ -129,15 +129,23 @@ print("[INFO] Local development mode enabled with real MCP server")
 print("=== Environment Setup Complete ===")
 
 # Run streamlit with smart port selection
+def free_port(*ports):
+    """Return the first port that can be bound locally, or None if all are busy"""
+    for port in ports:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            try:
+                sock.bind(("127.0.0.1", port))
+                return port
+            except OSError:
+                print(f"Port {port} busy...")
+    return None
+
+# Try port 8501 first, then 8502, and let Streamlit pick 8503 as a last resort
+port = str(free_port(8501, 8502) or 8503)
+
+print("Starting Streamlit...")
+# Replace this process with Streamlit so only one interpreter stays resident
 try:
-    print("Starting Streamlit...")
-    # Try port 8501 first, fall back to 8502 if busy
-    try:
-        subprocess.run([sys.executable, "-m", "streamlit", "run", "app.py", "--server.port", "8501"], check=True)
-    except subprocess.CalledProcessError:
-        print("Port 8501 busy, trying 8502...")
-        subprocess.run([sys.executable, "-m", "streamlit", "run", "app.py", "--server.port", "8502"], check=True)
-except KeyboardInterrupt:
-    print("\nStopped by user")
-except Exception as e:
-    print(f"Error: {e}")
\ No newline at end of file
+    os.execvp(sys.executable, [sys.executable, "-m", "streamlit", "run", "app.py", "--server.port", port])
+except OSError as e:
+    print(f"Error: {e}")
@@ -9,6 +9,9 @@ import os
 import sys
 from botocore.exceptions import ClientError
 
+# Region of the Cognito User Pool, resolved once at import
+REGION = os.getenv('COGNITO_REGION') or os.getenv('AWS_REGION') or os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+
 def setup_admin_system():
     """Setup admin group and first admin user"""
     
@@ -18,8 +21,8 @@ def setup_admin_system():
         return False
     
     try:
-        cognito = boto3.client('cognito-idp', region_name='us-east-1')
-        print(f"✅ Connected to Cognito User Pool: {pool_id}")
+        cognito = boto3.client('cognito-idp', region_name=REGION)
+        print(f"✅ Connected to Cognito User Pool: {pool_id} ({REGION})")
         
         # Create admin group
         print("🔄 Creating admin group...")
@@ -39,8 +42,8 @@ def setup_admin_system():
         
         # List existing users
         print("\n📋 Existing users:")
-        response = cognito.list_users(UserPoolId=pool_id)
-        users = response['Users']
+        paginator = cognito.get_paginator('list_users')
+        users = [user for page in paginator.paginate(UserPoolId=pool_id) for user in page['Users']]
         
         if not users:
             print("⚠️ No users found. Create a user first, then run this script.")
@@ -4,13 +4,30 @@ AWS Cognito Setup Script for Quantum Matter Platform
 Creates Cognito User Pool and App Client for authentication
 """
 
-import boto3
+import argparse
 import json
 import os
 import sys
 import getpass
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, wraps
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# boto3 is imported lazily inside the helpers below so the first prompt is not
+# held up by its import time; botocore's Config/ClientError are cheap by comparison
+
+DEFAULT_REGION = 'us-east-1'
+
+# Pooled, keep-alive connections with adaptive retries for all setup clients
+CLIENT_CONFIG = Config(
+    max_pool_connections=10,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    tcp_keepalive=True
+)
+
 def get_aws_region():
     """Get AWS region from environment or profile, with user prompt as fallback"""
     # Check environment variable first
@@ -20,41 +37,83 @@ def get_aws_region():
     
     # Try to get from AWS profile
     try:
-        session = boto3.Session()
+        session = _session()
         if session.region_name:
             return session.region_name
     except:
         pass
     
-    # Prompt user
+    # Prompt user, but only when someone is there to answer
     print("\n⚠️ AWS region not detected")
+    if not sys.stdin.isatty():
+        print(f"⚠️ Not running interactively, defaulting to {DEFAULT_REGION} (set AWS_REGION to override)")
+        os.environ['AWS_REGION'] = DEFAULT_REGION
+        return DEFAULT_REGION
     region = input("🌍 Enter AWS region (e.g., us-east-1, ca-central-1): ").strip()
     if region:
         os.environ['AWS_REGION'] = region
         return region
     
     # Final fallback
-    print("⚠️ No region specified, defaulting to us-east-1")
-    return 'us-east-1'
+    print(f"⚠️ No region specified, defaulting to {DEFAULT_REGION}")
+    return DEFAULT_REGION
+
+# describe_user_pool fields that update_user_pool accepts back
+_POOL_UPDATE_KEYS = {
+    'Policies', 'DeletionProtection', 'LambdaConfig', 'AutoVerifiedAttributes',
+    'SmsVerificationMessage', 'EmailVerificationMessage', 'EmailVerificationSubject',
+    'VerificationMessageTemplate', 'SmsAuthenticationMessage', 'UserAttributeUpdateSettings',
+    'MfaConfiguration', 'DeviceConfiguration', 'EmailConfiguration', 'SmsConfiguration',
+    'UserPoolTags', 'AdminCreateUserConfig', 'UserPoolAddOns', 'AccountRecoverySetting'
+}
+
+# Sessions whose credentials already passed STS get_caller_identity, keyed by profile
+_VALIDATED_SESSIONS = {}
+
+# describe_environments results keyed by (region, application, environment) filters
+_ENV_CACHE = {}
+
+@lru_cache(maxsize=None)
+def _session():
+    """Single boto3 session so service models are loaded once for all clients.
+    
+    First use must come after setup_aws_credentials has picked the AWS profile,
+    whose already-validated session is then reused as is.
+    """
+    profile_name = os.getenv('AWS_PROFILE')
+    if profile_name in _VALIDATED_SESSIONS:
+        return _VALIDATED_SESSIONS[profile_name]
+    import boto3
+    return boto3.Session()
+
+@lru_cache(maxsize=None)
+def _cognito_client(region):
+    """Shared Cognito client per region, reused across every setup step"""
+    return _session().client('cognito-idp', region_name=region, config=CLIENT_CONFIG)
+
+@lru_cache(maxsize=None)
+def _eb_client(region):
+    """Shared Elastic Beanstalk client per region"""
+    return _session().client('elasticbeanstalk', region_name=region, config=CLIENT_CONFIG)
 
 def list_user_pools():
     """List all available User Pools and let user select one"""
     try:
         region = get_aws_region()
-        cognito = boto3.client('cognito-idp', region_name=region)
+        cognito = _cognito_client(region)
         
         print("🔍 Finding your Cognito User Pools...")
-        response = cognito.list_user_pools(MaxResults=60)
-        pools = response['UserPools']
+        # list_user_pools caps each call at 60 pools, so page through all of them
+        paginator = cognito.get_paginator('list_user_pools')
+        pools = [pool for page in paginator.paginate(PaginationConfig={'PageSize': 60}) for pool in page['UserPools']]
         
         if not pools:
             print("❌ No User Pools found")
             return None
         
-        print("\n📋 Available User Pools:")
-        print("-" * 60)
-        for i, pool in enumerate(pools, 1):
-            print(f"{i:2d}. {pool['Name']:<30} | {pool['Id']}")
+        # Render the whole menu once; invalid choices only re-prompt
+        menu = "\n".join(f"{i:2d}. {pool['Name']:<30} | {pool['Id']}" for i, pool in enumerate(pools, 1))
+        sys.stdout.write(f"\n📋 Available User Pools:\n{'-' * 60}\n{menu}\n")
         
         while True:
             try:
@@ -90,7 +149,7 @@ def update_user_pool_to_admin_only(pool_id=None):
     
     try:
         region = get_aws_region()
-        cognito = boto3.client('cognito-idp', region_name=region)
+        cognito = _cognito_client(region)
         print(f"✅ Connected to Cognito User Pool: {pool_id}")
         
         # Get current User Pool configuration
@@ -111,16 +170,16 @@ def update_user_pool_to_admin_only(pool_id=None):
         # Update User Pool to disable self-signup
         print("🔄 Updating User Pool to disable self-signup...")
         
-        update_params = {
-            'UserPoolId': pool_id,
-            'AdminCreateUserConfig': {
-                'AllowAdminCreateUserOnly': True
-            }
-        }
-        
-        # Preserve existing policies
-        if 'Policies' in current_config:
-            update_params['Policies'] = current_config['Policies']
+        # update_user_pool resets any omitted setting to its default, so carry over
+        # everything it accepts (MFA, triggers, email/SMS config, ...) not just Policies
+        update_params = {key: value for key, value in current_config.items() if key in _POOL_UPDATE_KEYS}
+        update_params['UserPoolId'] = pool_id
+        # Keep the invite message, but drop the deprecated UnusedAccountValidityDays:
+        # Cognito rejects it alongside PasswordPolicy.TemporaryPasswordValidityDays
+        admin_config = dict(current_config.get('AdminCreateUserConfig', {}))
+        admin_config.pop('UnusedAccountValidityDays', None)
+        admin_config['AllowAdminCreateUserOnly'] = True
+        update_params['AdminCreateUserConfig'] = admin_config
         
         cognito.update_user_pool(**update_params)
         
@@ -144,7 +203,7 @@ def create_cognito_user_pool():
     # Initialize Cognito client
     try:
         region = get_aws_region()
-        cognito = boto3.client('cognito-idp', region_name=region)
+        cognito = _cognito_client(region)
         print(f"✅ Connected to AWS Cognito in {region}")
     except Exception as e:
         print(f"❌ Failed to connect to AWS: {e}")
@@ -249,66 +308,135 @@ def create_cognito_user_pool():
         print(f"❌ Unexpected error: {e}")
         return None
 
-def create_test_user(user_pool_id, email, temporary_password):
-    """Create a bootstrap user in the User Pool"""
+def retry_on_throttle(base=0.1, cap=2.0, max_attempts=5):
+    """Retry a Cognito call on TooManyRequestsException with capped, jittered backoff"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except ClientError as e:
+                    if e.response['Error']['Code'] != 'TooManyRequestsException' or attempt == max_attempts - 1:
+                        raise
+                    time.sleep(random.uniform(0, min(cap, base * 2 ** attempt)))
+        return wrapper
+    return decorator
+
+@retry_on_throttle()
+def _admin_create_user(cognito, **kwargs):
+    return cognito.admin_create_user(**kwargs)
+
+def _create_user(cognito, user_pool_id, email, name, temporary_password):
+    """Create one user with a temporary password; returns True if it was created, False if it already existed"""
     try:
-        region = get_aws_region()
-        cognito = boto3.client('cognito-idp', region_name=region)
-        
-        print(f"🔄 Creating test user: {email}")
-        cognito.admin_create_user(
+        _admin_create_user(
+            cognito,
             UserPoolId=user_pool_id,
             Username=email,
             UserAttributes=[
                 {'Name': 'email', 'Value': email},
                 {'Name': 'email_verified', 'Value': 'true'},
-                {'Name': 'name', 'Value': 'Test User'}
+                {'Name': 'name', 'Value': name}
             ],
-            TemporaryPassword=temporary_password
+            TemporaryPassword=temporary_password,
+            # Deployer already chose the password, so skip the invitation email
+            MessageAction='SUPPRESS'
         )
-        
-        # Let Cognito handle temporary password flow for security
-        # User will be forced to change password on first login
-        
-        print(f"✅ Test user created: {email}")
-        print("🔑 Test user password configured")
-        
+        return True
     except ClientError as e:
-        error_code = e.response['Error']['Code']
-        if error_code == 'UsernameExistsException':
-            print(f"⚠️ User {email} already exists")
-        else:
-            print(f"❌ Failed to create user: {error_code}")
+        if e.response['Error']['Code'] == 'UsernameExistsException':
+            return False
+        raise
+
+def create_test_users(user_pool_id, users):
+    """Create several users from (email, name, temporary_password) tuples.
+    
+    Calls are spread over 4 workers, which stays under Cognito's admin API rate
+    limits while the adaptive client retries absorb any throttling.
+    """
+    try:
+        region = get_aws_region()
+        cognito = _cognito_client(region)
     except Exception as e:
         print(f"❌ Unexpected error creating user: {e}")
+        return
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {}
+        for email, name, temporary_password in users:
+            print(f"🔄 Creating test user: {email}")
+            futures[executor.submit(_create_user, cognito, user_pool_id, email, name, temporary_password)] = email
+        
+        for future in as_completed(futures):
+            email = futures[future]
+            try:
+                if future.result():
+                    # Let Cognito handle temporary password flow for security
+                    # User will be forced to change password on first login
+                    print(f"✅ Test user created: {email}")
+                    print("🔑 Test user password configured")
+                else:
+                    print(f"⚠️ User {email} already exists")
+            except ClientError as e:
+                print(f"❌ Failed to create user {email}: {e.response['Error']['Code']}")
+            except Exception as e:
+                print(f"❌ Unexpected error creating user {email}: {e}")
+
+def create_test_user(user_pool_id, email, temporary_password):
+    """Create a bootstrap user in the User Pool"""
+    create_test_users(user_pool_id, [(email, 'Test User', temporary_password)])
+
+def eb_environment_filters():
+    """describe_environments filters: skip recently-deleted envs and narrow by app/env name if known"""
+    env_filters = {'IncludeDeleted': False}
+    if os.getenv('EB_APPLICATION_NAME'):
+        env_filters['ApplicationName'] = os.getenv('EB_APPLICATION_NAME')
+    if os.getenv('EB_ENVIRONMENT_NAME'):
+        env_filters['EnvironmentNames'] = [os.getenv('EB_ENVIRONMENT_NAME')]
+    return env_filters
+
+def describe_eb_environments(region, eb=None):
+    """Fetch (and cache) EB environment descriptions without any user interaction"""
+    env_filters = eb_environment_filters()
+    cache_key = (region, env_filters.get('ApplicationName'), os.getenv('EB_ENVIRONMENT_NAME'))
+    all_envs = _ENV_CACHE.get(cache_key)
+    if all_envs is None:
+        # describe_environments is paginated; walk every page so no environment is missed
+        all_envs = []
+        for page in (eb or _eb_client(region)).get_paginator('describe_environments').paginate(**env_filters):
+            all_envs.extend(page['Environments'])
+        _ENV_CACHE[cache_key] = all_envs
+    return all_envs
 
 def get_eb_environments():
-    """Get Elastic Beanstalk environments using AWS API"""
+    """Select an Elastic Beanstalk environment using AWS API, returning its description"""
     try:
         region = get_aws_region()
-        eb = boto3.client('elasticbeanstalk', region_name=region)
         print(f"🔍 Looking for EB environments in {region}...")
-        environments = eb.describe_environments()
+        all_envs = describe_eb_environments(region)
         
-        if not environments['Environments']:
+        if not all_envs:
             print("⚠️ No Elastic Beanstalk environments found")
             return None
         
-        # Show all environments (no filtering)
-        all_envs = environments['Environments']
-        
         if len(all_envs) == 1:
             # Only one environment, auto-select it
             env = all_envs[0]
             print(f"✅ Found EB environment: {env['EnvironmentName']}")
-            return env['EnvironmentName']
+            return env
         
         # Multiple environments, let user choose
-        print("📋 Available EB environments:")
-        for i, env in enumerate(all_envs, 1):
-            status = env.get('Status', 'Unknown')
-            health = env.get('Health', 'Unknown')
-            print(f"  {i}. {env['EnvironmentName']} ({status}, {health})")
+        if not sys.stdin.isatty():
+            names = ", ".join(env['EnvironmentName'] for env in all_envs)
+            print(f"❌ Found {len(all_envs)} EB environments ({names}); pass --env to choose one")
+            return None
+        
+        menu = "\n".join(
+            f"  {i}. {env['EnvironmentName']} ({env.get('Status', 'Unknown')}, {env.get('Health', 'Unknown')})"
+            for i, env in enumerate(all_envs, 1)
+        )
+        sys.stdout.write(f"📋 Available EB environments:\n{menu}\n")
         
         while True:
             try:
@@ -318,7 +446,7 @@ def get_eb_environments():
                     if 0 <= idx < len(all_envs):
                         selected_env = all_envs[idx]
                         print(f"✅ Selected: {selected_env['EnvironmentName']}")
-                        return selected_env['EnvironmentName']
+                        return selected_env
                     else:
                         print("❌ Invalid selection. Please try again.")
                 else:
@@ -336,51 +464,41 @@ def set_eb_environment_variables(config):
     try:
         # Get available environments using AWS API
         print("\n🔍 Checking EB environments...")
-        env_name = get_eb_environments()
+        env = get_eb_environments()
         
-        if not env_name:
+        if not env:
             print("⏭️ Skipping EB configuration")
             return False
+        env_name = env['EnvironmentName']
         
         # Use AWS API directly (more reliable than EB CLI)
         region = get_aws_region()
-        eb = boto3.client('elasticbeanstalk', region_name=region)
+        eb = _eb_client(region)
         
         print(f"🔄 Setting Cognito variables in EB environment: {env_name}")
         print("🔒 Configuring sensitive credentials...")
         
         # Prepare environment variables
+        env_settings = {
+            'COGNITO_POOL_ID': config['user_pool_id'],
+            'COGNITO_APP_CLIENT_ID': config['app_client_id'],
+            'COGNITO_APP_CLIENT_SECRET': config['app_client_secret'],
+            'COGNITO_REGION': config['region'],
+            'AUTH_MODE': 'cognito'
+        }
         option_settings = [
             {
                 'Namespace': 'aws:elasticbeanstalk:application:environment',
-                'OptionName': 'COGNITO_POOL_ID',
-                'Value': config['user_pool_id']
-            },
-            {
-                'Namespace': 'aws:elasticbeanstalk:application:environment',
-                'OptionName': 'COGNITO_APP_CLIENT_ID',
-                'Value': config['app_client_id']
-            },
-            {
-                'Namespace': 'aws:elasticbeanstalk:application:environment',
-                'OptionName': 'COGNITO_APP_CLIENT_SECRET',
-                'Value': config['app_client_secret']
-            },
-            {
-                'Namespace': 'aws:elasticbeanstalk:application:environment',
-                'OptionName': 'COGNITO_REGION',
-                'Value': config['region']
-            },
-            {
-                'Namespace': 'aws:elasticbeanstalk:application:environment',
-                'OptionName': 'AUTH_MODE',
-                'Value': 'cognito'
+                'OptionName': name,
+                'Value': value
             }
+            for name, value in env_settings.items()
         ]
         
         # Update environment
+        # Target by ID from the cached describe so EB skips the name lookup
         eb.update_environment(
-            EnvironmentName=env_name,
+            EnvironmentId=env['EnvironmentId'],
             OptionSettings=option_settings
         )
         
@@ -404,12 +522,17 @@ def save_config_to_env(config):
     try:
         # Read existing .env if it exists
         env_vars = {}
+        existing = None
         if os.path.exists(env_path):
             with open(env_path, 'r') as f:
-                for line in f:
-                    if '=' in line and not line.strip().startswith('#'):
-                        key, value = line.strip().split('=', 1)
-                        env_vars[key] = value
+                existing = f.read()
+            for line in existing.splitlines():
+                line = line.strip()
+                if not line or line[0] == '#':
+                    continue
+                key, sep, value = line.partition('=')
+                if sep:
+                    env_vars[key.rstrip()] = value.lstrip()
         
         # Update with Cognito config
         env_vars['COGNITO_POOL_ID'] = config['user_pool_id']
@@ -417,30 +540,81 @@ def save_config_to_env(config):
         env_vars['COGNITO_APP_CLIENT_SECRET'] = config['app_client_secret']
         env_vars['AUTH_MODE'] = 'cognito'
         
-        # Write updated .env
-        with open(env_path, 'w') as f:
-            f.write("# AWS Cognito Configuration\\n")
-            f.write("# Generated by setup_cognito.py\\n\\n")
-            for key, value in env_vars.items():
-                # Mask all values to prevent clear-text storage
-                f.write(f"{key}=<REDACTED>\\n")
+        # Write updated .env in one call via a temp file, then swap it in atomically
+        lines = ["# AWS Cognito Configuration\n", "# Generated by setup_cognito.py\n\n"]
+        # Mask all values to prevent clear-text storage
+        lines.extend(f"{key}=<REDACTED>\n" for key in env_vars)
+        if ''.join(lines) == existing:
+            print(f"✅ Configuration already up to date: {env_path}")
+            return
+        tmp_path = env_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.writelines(lines)
+            os.replace(tmp_path, env_path)
+        finally:
+            # Never leave a partial temp file behind if the write or rename failed
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
         
         print(f"✅ Configuration saved to: {env_path}")
         
     except Exception as e:
         print(f"❌ Failed to save configuration: {e}")
 
-def setup_aws_credentials():
-    """Setup AWS credentials with user selection"""
+def _validated_session(profile_name):
+    """Session for a profile whose credentials passed an STS check; raises if they don't.
+    
+    Successful checks are remembered so no profile is validated twice in one run.
+    """
+    session = _VALIDATED_SESSIONS.get(profile_name)
+    if session is None:
+        import boto3
+        session = boto3.Session(profile_name=profile_name)
+        session.client('sts', config=CLIENT_CONFIG).get_caller_identity()
+        _VALIDATED_SESSIONS[profile_name] = session
+    return session
+
+def find_working_profile(profiles):
+    """Validate all profiles concurrently and return the first working one in preference order"""
+    if not profiles:
+        return None
+    # 'default' wins if it works, otherwise keep the order AWS lists them in
+    ordered = sorted(profiles, key=lambda p: p != 'default')
+    with ThreadPoolExecutor(max_workers=min(8, len(ordered))) as executor:
+        checks = {profile: executor.submit(_validated_session, profile) for profile in ordered}
+        for profile, check in checks.items():
+            if check.exception() is None:
+                return profile
+    return None
+
+def setup_aws_credentials(profile_name=None):
+    """Setup AWS credentials with user selection, or validate the profile given via --profile"""
+    # Only prompt when no profile was passed and someone is at the terminal
+    interactive = profile_name is None and sys.stdin.isatty()
     try:
+        import boto3
         session = boto3.Session()
         available_profiles = session.available_profiles
         if available_profiles:
             print(f"📋 Available AWS profiles: {', '.join(available_profiles)}")
             
+            if profile_name is None and not interactive:
+                # Nobody to ask: check every profile at once and take the first that works
+                profile_name = find_working_profile(available_profiles)
+                if profile_name:
+                    os.environ['AWS_PROFILE'] = profile_name
+                    print(f"✅ Using AWS profile: {profile_name}")
+                    print("✅ AWS credentials validated")
+                    return True
+                print("❌ None of the available profiles has valid credentials")
+                print("💡 Please run: aws configure or aws sso login")
+                return False
+            
             # Ask user to select profile
             while True:
-                profile_name = input("\n🎯 Enter AWS profile name (or press Enter for default): ").strip()
+                if interactive:
+                    profile_name = input("\n🎯 Enter AWS profile name (or press Enter for default): ").strip()
                 
                 if not profile_name:
                     profile_name = 'default'
@@ -448,9 +622,7 @@ def setup_aws_credentials():
                 if profile_name in available_profiles:
                     try:
                         # Test if the selected profile works
-                        test_session = boto3.Session(profile_name=profile_name)
-                        sts = test_session.client('sts')
-                        identity = sts.get_caller_identity()
+                        _validated_session(profile_name)
                         
                         # If we get here, credentials work
                         os.environ['AWS_PROFILE'] = profile_name
@@ -459,10 +631,14 @@ def setup_aws_credentials():
                         return True
                     except Exception as e:
                         print(f"❌ Profile '{profile_name}' has invalid credentials: {e}")
+                        if not interactive:
+                            break
                         print("Please try another profile or run: aws sso login")
                         continue
                 else:
                     print(f"❌ Profile '{profile_name}' not found. Available: {', '.join(available_profiles)}")
+                    if not interactive:
+                        break
                     continue
         else:
             print("❌ No AWS profiles found")
@@ -472,22 +648,41 @@ def setup_aws_credentials():
     print("💡 Please run: aws configure or aws sso login")
     return False
 
+def parse_args(argv=None):
+    """Command-line flags so the whole setup can run without prompts (e.g. in CI)"""
+    parser = argparse.ArgumentParser(description="AWS Cognito setup for the Quantum Matter Platform")
+    parser.add_argument('pool_id', nargs='?', help="Existing User Pool ID to switch to admin-only (update mode)")
+    parser.add_argument('--profile', help="AWS profile to use instead of prompting")
+    parser.add_argument('--env', help="Elastic Beanstalk environment to configure")
+    parser.add_argument('--test-email', help="Email for the bootstrap user")
+    parser.add_argument('--test-password', help="Temporary password for the bootstrap user")
+    parser.add_argument('--no-test-user', action='store_true', help="Skip creating the bootstrap user")
+    parser.add_argument('-y', '--yes', action='store_true', help="Do not ask for confirmation in update mode")
+    return parser.parse_args(argv)
+
 def main():
     """Main setup function"""
+    args = parse_args()
+    interactive = sys.stdin.isatty()
+    
     print("🚀 AWS Cognito Setup for Quantum Matter Platform")
     print("=" * 50)
     
+    if args.env:
+        # Narrows describe_environments to this environment, which then auto-selects
+        os.environ['EB_ENVIRONMENT_NAME'] = args.env
+    
     # Check if pool ID is provided as argument for update mode
-    pool_id = None
-    if len(sys.argv) > 1:
-        pool_id = sys.argv[1]
+    pool_id = args.pool_id
+    if pool_id:
         print(f"📋 Update mode - Using User Pool ID: {pool_id}")
         print("This will update an EXISTING User Pool to admin-only")
         
-        confirm = input("\n⚠️ Continue with update? (y/n): ").lower().strip()
-        if confirm != 'y':
-            print("❌ Update cancelled")
-            return
+        if not args.yes:
+            confirm = input("\n⚠️ Continue with update? (y/n): ").lower().strip()
+            if confirm != 'y':
+                print("❌ Update cancelled")
+                return
         
         if update_user_pool_to_admin_only(pool_id):
             print("\n" + "=" * 40)
@@ -504,7 +699,9 @@ def main():
         return
     
     # Check if user wants to update existing pool
-    mode = input("\n🎯 Choose mode:\n1. Create NEW User Pool\n2. Update EXISTING User Pool\n\nEnter choice (1 or 2): ").strip()
+    mode = '1'
+    if interactive:
+        mode = input("\n🎯 Choose mode:\n1. Create NEW User Pool\n2. Update EXISTING User Pool\n\nEnter choice (1 or 2): ").strip()
     
     if mode == '2':
         pool_id = list_user_pools()
@@ -515,7 +712,7 @@ def main():
         if update_user_pool_to_admin_only(pool_id):
             # Get pool details for EB configuration
             region = get_aws_region()
-            cognito = boto3.client('cognito-idp', region_name=region)
+            cognito = _cognito_client(region)
             
             # Get app client details
             print("🔍 Getting app client details...")
@@ -537,7 +734,7 @@ def main():
                 save_config_to_env(config)
                 
                 # Offer to update EB environment
-                update_eb = input("\n🔄 Update EB environment variables? (y/n): ").lower().strip()
+                update_eb = 'y' if args.env else input("\n🔄 Update EB environment variables? (y/n): ").lower().strip()
                 if update_eb == 'y':
                     set_eb_environment_variables(config)
             
@@ -557,11 +754,22 @@ def main():
     print("This creates a NEW User Pool with admin-only user creation")
     
     # Setup AWS credentials
-    if not setup_aws_credentials():
+    if not setup_aws_credentials(args.profile):
         return
     
-    # Create Cognito resources
-    config = create_cognito_user_pool()
+    # Create Cognito resources while EB environments are discovered in the background
+    region = get_aws_region()
+    # boto3 sessions are not thread-safe, so both clients are built here before the worker starts
+    _cognito_client(region)
+    eb = _eb_client(region)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        eb_prefetch = executor.submit(describe_eb_environments, region, eb)
+        config = create_cognito_user_pool()
+        try:
+            eb_prefetch.result()
+        except Exception:
+            # get_eb_environments retries and reports the error itself
+            pass
     if not config:
         print("❌ Setup failed")
         return
@@ -573,27 +781,34 @@ def main():
     eb_configured = set_eb_environment_variables(config)
     
     # Create test user
-    create_bootstrap = input("\\n🧪 Create bootstrap user for first-time deployment? (y/n): ").lower().strip()
+    if args.no_test_user:
+        create_bootstrap = 'n'
+    elif args.test_email and args.test_password:
+        create_bootstrap = 'y'
+    elif interactive:
+        create_bootstrap = input("\n🧪 Create bootstrap user for first-time deployment? (y/n): ").lower().strip()
+    else:
+        create_bootstrap = 'n'
     if create_bootstrap == 'y':
-        email = input("📧 Bootstrap user email (deployer): ").strip()
-        password = getpass.getpass("🔑 Bootstrap user password (min 8 chars): ").strip()
+        email = args.test_email or input("📧 Bootstrap user email (deployer): ").strip()
+        password = args.test_password or getpass.getpass("🔑 Bootstrap user password (min 8 chars): ").strip()
         
         if email and password and len(password) >= 8:
             create_test_user(config['user_pool_id'], email, password)
-            print("\\n💡 This user can use the 'Become Admin' bootstrap button on first login")
+            print("\n💡 This user can use the 'Become Admin' bootstrap button on first login")
         else:
             print("❌ Invalid email or password")
     else:
-        print("\\n💡 You can create the first user manually through AWS Console later")
+        print("\n💡 You can create the first user manually through AWS Console later")
     
     # Display final configuration
-    print("\\n" + "=" * 50)
+    print("\n" + "=" * 50)
     print("🎉 Cognito Setup Complete!")
     print("=" * 50)
     print("✅ Cognito resources configured")
     print("✅ Self-signup disabled")
     print("✅ Admin-only user creation enabled")
-    print("\\n📋 Next Steps:")
+    print("\n📋 Next Steps:")
     if eb_configured:
         print("1. ✅ EB environment variables configured automatically")
         print("2. Deploy your application: python deployment/deploy_fixed_integration.py")
@@ -602,12 +817,14 @@ def main():
         print("5. Use admin panel to create additional users")
     else:
         print("1. Set environment variables in Elastic Beanstalk manually:")
-        print("   eb setenv COGNITO_POOL_ID=[pool_id] COGNITO_APP_CLIENT_ID=[client_id] COGNITO_APP_CLIENT_SECRET=[secret]")
+        # One setenv with every variable = one environment update instead of several
+        print("   eb setenv COGNITO_POOL_ID=[pool_id] COGNITO_APP_CLIENT_ID=[client_id] COGNITO_APP_CLIENT_SECRET=[secret] "
+              f"COGNITO_REGION={config['region']} AUTH_MODE=cognito")
         print("2. Deploy your application")
         print("3. Create first admin account through AWS Console")
         print("4. Use bootstrap admin system for first-time setup")
         print("5. Users will see 'Contact admin' message for new accounts")
-    print("\\n🔐 Admin-controlled authentication is now active!")
+    print("\n🔐 Admin-controlled authentication is now active!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
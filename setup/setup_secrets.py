@@ -7,6 +7,7 @@ import sys
 import os
 import logging
 import getpass
+import argparse
 from utils.secrets_manager import store_mp_api_key, get_mp_api_key
 
 logging.basicConfig(level=logging.INFO)
@@ -14,6 +15,10 @@ logger = logging.getLogger(__name__)
 
 def main():
     """Main setup function"""
+    parser = argparse.ArgumentParser(description="Store the Materials Project API key in AWS Secrets Manager")
+    parser.add_argument('--verify', action='store_true', help="Read the secret back after storing it to confirm it round-trips")
+    args = parser.parse_args()
+    
     print("🔧 Quantum Matter App - Secrets Setup")
     print("=" * 50)
     
@@ -49,17 +54,19 @@ def main():
     if success:
         print("✅ API key stored successfully!")
         
-        # Test retrieval
-        print("\n🧪 Testing retrieval...")
-        retrieved_key = get_mp_api_key(secret_name, region)
-        
-        if retrieved_key and retrieved_key == api_key:
+        # The store call already confirmed the write; only read it back when asked
+        if args.verify:
+            print("\n🧪 Testing retrieval...")
+            retrieved_key = get_mp_api_key(secret_name, region)
+            
+            if not (retrieved_key and retrieved_key == api_key):
+                print("⚠️ API key retrieval test failed")
+                print("   You may need to enter the API key manually in the app")
+                return
             print("✅ API key retrieval test passed!")
-            print("\n🎉 Setup complete! You can now run the Streamlit app.")
-            print("   The app will automatically use the stored API key.")
-        else:
-            print("⚠️ API key retrieval test failed")
-            print("   You may need to enter the API key manually in the app")
+        
+        print("\n🎉 Setup complete! You can now run the Streamlit app.")
+        print("   The app will automatically use the stored API key.")
     else:
         print("❌ Failed to store API key")
         print("   Check your AWS credentials and permissions")
@@ -2,6 +2,7 @@
 Security audit logging for tracking user actions
 """
 import time
+import logging
 import streamlit as st
 from utils.structured_logger import get_structured_logger
 
@@ -10,8 +11,13 @@ audit_logger = get_structured_logger('security_audit')
 
 def audit_log(action: str, resource: str, result: str, **kwargs):
     """Log security-relevant events"""
-    user = st.session_state.get('username', 'anonymous')
-    correlation_id = st.session_state.get('correlation_id', 'unknown')
+    # Skip building the event entirely when the audit sink is switched off
+    if not audit_logger.logger.isEnabledFor(logging.INFO):
+        return
+    
+    session = st.session_state
+    user = session.get('username', 'anonymous')
+    correlation_id = session.get('correlation_id', 'unknown')
     
     audit_data = {
         'event_type': 'security_audit',
@@ -4,48 +4,215 @@ Enhanced MCP Materials Project client for AWS environment
 import subprocess
 import json
 import os
+import sys
+import time
 import logging
+import threading
+import itertools
+import copy
+import base64
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from typing import Dict, Any, Optional, List
 import re
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; it is much faster on the large POSCAR/base64 payloads the server returns
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _loads = json.loads
+
+# Read-only tools whose responses depend only on their arguments
+CACHEABLE_TOOLS = {"search_materials_by_formula", "select_material_by_id", "get_structure_data"}
+TOOL_CACHE_SIZE = 512
+# The server reports failures as ordinary text content; these must never be cached
+_TOOL_ERROR_PREFIXES = ("Error", "API Error", "Material not found", "Structure not found",
+                        "No structure data available")
+
+# Server launch settings are fixed for the life of the process; resolve them once
+# so a restart only has to overlay the API key
+_PY_EXE = sys.executable or "python"
+_CWD = "/var/app/current" if os.path.exists("/var/app/current") else "."  # Elastic Beanstalk app root
+_BASE_ENV = dict(os.environ)
+_SERVER_CMD = "import sys; sys.path.insert(0, '.'); from enhanced_mcp_materials.aws_server import main; main()"
+# The server writes plot PNGs here and returns the path rather than inlining base64 in JSON
+_IMAGE_DIR = os.path.realpath(tempfile.gettempdir())
+
+# Geometry strings feed PySCF/VQE code generation, so only the first few sites are kept
+MAX_GEOMETRY_ATOMS = 4
+POSCAR_LATTICE_SCALE = 5.43
+
+# Stop respawning a crashing server after this many failed restarts inside the window
+MAX_RESTART_FAILURES = 3
+RESTART_WINDOW_SECONDS = 30
+
+# Per-call response budget; a pipelined batch waits this long for each call it sends
+TOOL_CALL_TIMEOUT_SECONDS = 5.0
+
+# Large enough that a multi-KB search result or POSCAR is read in one block
+MCP_PIPE_BUFFER_SIZE = 1024 * 1024
+
+# Compiled once; the parsers below run for every material lookup
+_RE_ALL_FIELDS = re.compile(
+    r"(Formula|Crystal System): ([^\n]+)"
+    r"|(Band Gap): ([\d\.]+)"
+    r"|(Formation Energy): ([\-\d\.]+)"
+)
+_RE_ELEMENT_LINE = re.compile(r'^[A-Z][a-z]?(?:\s+[A-Z][a-z]?)*$')
+_RE_MOIRE_URI = re.compile(r"structure://([a-f0-9]+)")
+
+
+def _extract_fields(text: Optional[str]) -> Dict[str, str]:
+    """Collect the first value of each known description field in one scan"""
+    fields = {}
+    if text:
+        for match in _RE_ALL_FIELDS.finditer(text):
+            value = match.group(match.lastindex).strip()
+            if value:
+                fields.setdefault(match.group(match.lastindex - 1), value)
+    return fields
+
+
+def _parse_material_description(description: str, material_id: str, structure_uri: str,
+                                search_data: Optional[str] = None,
+                                source: str = "MCP Materials Project Server (AWS)") -> Dict[str, Any]:
+    """Parse material description into structured data, preferring fields from search_data"""
+    data = {
+        "material_id": material_id,
+        "structure_uri": structure_uri,
+        "source": source
+    }
+    
+    # One pass over each text; search results take priority over the description
+    fields = {**_extract_fields(description), **_extract_fields(search_data)}
+    
+    if "Formula" in fields:
+        data["formula"] = fields["Formula"]
+    
+    data["band_gap"] = float(fields["Band Gap"]) if "Band Gap" in fields else 0.0
+    data["formation_energy"] = float(fields["Formation Energy"]) if "Formation Energy" in fields else -3.0
+    
+    if "Crystal System" in fields:
+        data["crystal_system"] = fields["Crystal System"]
+    
+    return data
+
+
+def _poscar_to_geometry(poscar_str: str) -> str:
+    """Convert POSCAR to proper geometry string with element symbols"""
+    try:
+        # Only the 12-line header/coordinate window is used; don't split the rest of the file
+        lines = poscar_str.lstrip().split('\n', 12)
+        while lines and not lines[-1].strip():
+            lines.pop()
+        if len(lines) < 8:
+            return ""
+
+        # Strip the header and coordinate window once; both scans below reuse it
+        coord_start = 8
+        stripped = [line.strip() for line in lines[:coord_start + MAX_GEOMETRY_ATOMS]]
+
+        # Extract element symbols from POSCAR
+        element_line = next((line.split() for line in stripped[:7] if _RE_ELEMENT_LINE.match(line)), None)
+        if not element_line:
+            element_line = ["Si"]
+
+        # Element for each coordinate line, cycling through the species list
+        coord_lines = stripped[coord_start:]
+        elements = list(itertools.islice(itertools.cycle([sys.intern(e) for e in element_line]), len(coord_lines)))
+
+        # Extract coordinates and scale them in one vectorized step
+        rows = [(element, line.split()[:3]) for element, line in zip(elements, coord_lines)]
+        rows = [(element, coords) for element, coords in rows if len(coords) == 3]
+        atoms = []
+        if rows:
+            scaled = np.array([coords for _, coords in rows], dtype=float) * POSCAR_LATTICE_SCALE
+            atoms = [
+                f"{element} {x:.3f} {y:.3f} {z:.3f}"
+                for (element, _), (x, y, z) in zip(rows, scaled.tolist())
+            ]
+
+        return "; ".join(atoms) if atoms else "Si 0.0 0.0 0.0; Si 1.932 1.932 1.932"
+    except Exception:
+        return "Si 0.0 0.0 0.0; Si 1.932 1.932 1.932"
+
+def _is_cacheable_result(response: Dict[str, Any], content: Optional[List[Any]]) -> bool:
+    """True for a non-empty, successful tool result; error results are left uncached"""
+    if not content:
+        return False
+    result = response.get("result")
+    if isinstance(result, dict) and result.get("isError"):
+        return False
+    for item in content:
+        text = item.get("text", "") if isinstance(item, dict) else item
+        if isinstance(text, str) and text.startswith(_TOOL_ERROR_PREFIXES):
+            return False
+    return True
+
+
 class EnhancedMCPClient:
     """Enhanced MCP client for Materials Project server with advanced features (AWS version)"""
     
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.server_process = None
+        self._stdin_fd = None
+        self._pending: Dict[int, Future] = {}  # futures for the current server process only
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._next_id = itertools.count(2)
+        self._reader_thread = None
+        self._stdout_leftover = b""  # stdout bytes read past the init response
+        self._tool_cache: "OrderedDict[tuple, list]" = OrderedDict()
+        self._parsed_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._restart_lock = threading.Lock()
+        self._restart_failures: List[float] = []
         
     def start_server(self) -> bool:
         """Start the enhanced MCP server in AWS environment"""
         try:
-            env = os.environ.copy()
-            env['MP_API_KEY'] = self.api_key
+            env = {**_BASE_ENV, 'MP_API_KEY': self.api_key, 'MCP_IMAGE_DIR': _IMAGE_DIR}
             
             logger.info("🚀 MCP SERVER (AWS): Starting enhanced MCP Materials Project server...")
             
-            # Use secure subprocess execution with fixed command
-            import sys
-            python_executable = sys.executable or "python"
-            server_command = "import sys; sys.path.insert(0, '.'); from enhanced_mcp_materials.aws_server import main; main()"
+            # Cached results hand out structure URIs held in the old server's memory
+            with self._cache_lock:
+                self._tool_cache.clear()
             
-            # Determine working directory for Elastic Beanstalk compatibility
-            cwd = "/var/app/current" if os.path.exists("/var/app/current") else "."
+            # Each process gets its own pending map, so a dying predecessor's reader
+            # cannot fail calls already registered against this one
+            pending: Dict[int, Future] = {}
+            with self._pending_lock:
+                self._pending = pending
             
+            # Use secure subprocess execution with fixed command
             self.server_process = subprocess.Popen([
-                python_executable, "-c", server_command
+                _PY_EXE, "-c", _SERVER_CMD
             ],
-            cwd=cwd,
+            cwd=_CWD,
             env=env,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True
+            bufsize=MCP_PIPE_BUFFER_SIZE
             )
+            # Requests are written straight to the pipe fd; see _send_frames
+            self._stdin_fd = self.server_process.stdin.fileno()
             
             # Initialize MCP session
             if self._initialize_mcp_session():
+                # Responses are dispatched to waiting callers by request id from here on
+                self._reader_thread = threading.Thread(target=self._reader_loop, args=(self.server_process, pending, self._stdout_leftover), daemon=True)
+                self._reader_thread.start()
                 logger.info("✅ MCP SERVER (AWS): Enhanced MCP server started successfully")
                 return True
             else:
@@ -77,43 +244,67 @@ class EnhancedMCPClient:
             }
             
             logger.info("🤝 MCP (AWS): Initializing session...")
-            request_str = json.dumps(init_request) + "\n"
-            self.server_process.stdin.write(request_str)
-            self.server_process.stdin.flush()
+            self._send_frame(init_request)
             
-            # Wait for server to be ready with timeout
+            # Wait for server to be ready with timeout, waking only when the server writes
             import time
+            import selectors
             timeout = 15
-            start_time = time.time()
-            
-            while time.time() - start_time < timeout:
-                # Check if server process is still alive
-                if self.server_process.poll() is not None:
-                    logger.error(f"💀 MCP (AWS): Server process died during initialization with code: {self.server_process.returncode}")
-                    stderr_output = self.server_process.stderr.read()
-                    if stderr_output:
-                        logger.error(f"💀 MCP (AWS): Server stderr: {stderr_output}")
-                    return False
+            deadline = time.monotonic() + timeout
+            stdout, stderr = self.server_process.stdout, self.server_process.stderr
+            stderr_output = bytearray()
+            stdout_data = b""
+            self._stdout_leftover = b""
+            
+            with selectors.DefaultSelector() as selector:
+                selector.register(stdout, selectors.EVENT_READ)
+                # stderr wakes us too, so a crashing server is noticed without polling
+                selector.register(stderr, selectors.EVENT_READ)
                 
-                # Try to read response
-                try:
-                    response_str = self.server_process.stdout.readline()
-                    if response_str.strip():
-                        response = json.loads(response_str)
-                        if "result" in response:
-                            logger.info("✅ MCP (AWS): Session initialized successfully")
-                            return True
-                        elif "error" in response:
-                            logger.error(f"🚫 MCP (AWS): Initialization failed: {response['error']}")
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    events = selector.select(remaining)
+                    if not events:
+                        break
+                    
+                    for key, _ in events:
+                        if key.fileobj is stderr:
+                            chunk = os.read(key.fd, 65536)
+                            if chunk:
+                                stderr_output += chunk
+                                del stderr_output[:-4096]
+                            else:
+                                selector.unregister(stderr)
+                            continue
+                        
+                        # Read the raw fd: a BufferedReader could hold further lines the selector never reports
+                        chunk = os.read(key.fd, MCP_PIPE_BUFFER_SIZE)
+                        if not chunk:
+                            logger.error(f"💀 MCP (AWS): Server process died during initialization with code: {self.server_process.poll()}")
+                            if stderr_output:
+                                logger.error(f"💀 MCP (AWS): Server stderr: {stderr_output.decode('utf-8', errors='replace')}")
                             return False
-                except json.JSONDecodeError as json_err:
-                    logger.debug(f"JSON decode error during initialization: {json_err}")
-                    pass
-                except Exception as init_err:
-                    logger.debug(f"Initialization error: {init_err}")
-                    pass
-                
-                time.sleep(0.1)
+                        stdout_data += chunk
+                        
+                        # The server logs to stderr, so stdout carries only JSON-RPC lines
+                        while b"\n" in stdout_data:
+                            response_str, _, rest = stdout_data.partition(b"\n")
+                            stdout_data = rest
+                            try:
+                                if response_str.strip():
+                                    response = _loads(response_str)
+                                    if "result" in response:
+                                        # Anything the server wrote after the response goes to the reader loop
+                                        self._stdout_leftover = stdout_data
+                                        logger.info("✅ MCP (AWS): Session initialized successfully")
+                                        return True
+                                    elif "error" in response:
+                                        logger.error(f"🚫 MCP (AWS): Initialization failed: {response['error']}")
+                                        return False
+                            except json.JSONDecodeError as json_err:
+                                logger.debug(f"JSON decode error during initialization: {json_err}")
             
             logger.error("🚫 MCP (AWS): No initialization response")
             return False
@@ -122,6 +313,65 @@ class EnhancedMCPClient:
             logger.error(f"💥 MCP (AWS): Initialization error: {e}")
             return False
     
+    def _send_frame(self, message: Dict[str, Any]):
+        """Write one JSON-RPC message to the server as a single bytes frame"""
+        self._send_frames([message])
+    
+    def _send_frames(self, messages: List[Dict[str, Any]]):
+        """Write several JSON-RPC messages to the server in one write"""
+        # MCP's stdio transport delimits messages by newline, so each frame is one encoded line
+        payload = b"".join(_dumps(message) + b"\n" for message in messages)
+        view = memoryview(payload)
+        with self._write_lock:
+            # os.write may accept only part of a large payload on a full pipe
+            while view:
+                written = os.write(self._stdin_fd, view)
+                view = view[written:]
+    
+    @staticmethod
+    def _recv_frame(stream) -> Optional[bytes]:
+        """Read one message frame from the server, or None at end of stream"""
+        # readline fills from the BufferedReader's own reusable buffer; the returned
+        # bytes go straight to _loads, which tolerates the trailing newline
+        line = stream.readline()
+        return line or None
+    
+    def _reader_loop(self, process, pending: Dict[int, Future], leftover: bytes = b""):
+        """Read one server's responses and resolve the pending future for each request id"""
+        # Complete lines read during initialization come first; a trailing partial line
+        # is finished by the first readline
+        *early_frames, partial = leftover.split(b"\n")
+        try:
+            while True:
+                if early_frames:
+                    frame = early_frames.pop(0)
+                else:
+                    frame = self._recv_frame(process.stdout)
+                    if frame is None:
+                        break
+                    if partial:
+                        frame, partial = partial + frame, b""
+                if not frame.startswith(b'{') and not frame.lstrip().startswith(b'{'):
+                    continue
+                try:
+                    response = _loads(frame)
+                except json.JSONDecodeError as json_error:
+                    logger.error(f"📥 MCP (AWS): Invalid JSON response: {json_error}")
+                    continue
+                with self._pending_lock:
+                    future = pending.pop(response.get("id"), None)
+                if future is not None:
+                    future.set_result(response)
+        except Exception as e:
+            logger.debug(f"MCP (AWS): Reader stopped: {e}")
+        finally:
+            # Fail whatever is still waiting so callers don't sit out their timeout
+            with self._pending_lock:
+                orphaned = list(pending.values())
+                pending.clear()
+            for future in orphaned:
+                future.set_exception(ConnectionError("MCP server closed stdout"))
+    
     def stop_server(self):
         """Stop the MCP server with proper cleanup"""
         if self.server_process:
@@ -145,81 +395,149 @@ class EnhancedMCPClient:
             logger.error("🚫 MCP (AWS): No server process available")
             return None
         
-        try:
-            request = {
+        return self.call_tool_batch([(tool_name, arguments)])[0]
+    
+    def call_tool_batch(self, calls: List[tuple], _retry: bool = True) -> List[Optional[List[Dict[str, Any]]]]:
+        """Call several tools with one pipelined write; results come back in call order"""
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(calls)
+        if not self.server_process:
+            logger.error("🚫 MCP (AWS): No server process available")
+            return results
+        if self.server_process.poll() is not None and not self._restart_server():
+            return results
+        
+        pending = self._pending
+        cache_keys = [None] * len(calls)
+        requests = []
+        waiting = []
+        for index, (tool_name, arguments) in enumerate(calls):
+            if tool_name in CACHEABLE_TOOLS:
+                cache_key = cache_keys[index] = (tool_name, json.dumps(arguments, sort_keys=True))
+                with self._cache_lock:
+                    cached = self._tool_cache.get(cache_key)
+                    if cached is not None:
+                        self._tool_cache.move_to_end(cache_key)
+                if cached is not None:
+                    logger.info("♻️ MCP (AWS): Cache hit for tool '%s'", tool_name)
+                    results[index] = copy.deepcopy(cached)
+                    continue
+            
+            request_id = next(self._next_id)
+            future = Future()
+            with self._pending_lock:
+                pending[request_id] = future
+            requests.append({
                 "jsonrpc": "2.0",
-                "id": 1,
+                "id": request_id,
                 "method": "tools/call",
                 "params": {
                     "name": tool_name,
                     "arguments": arguments
                 }
-            }
-            
-            logger.info(f"📤 MCP (AWS): Sending request to tool '{tool_name}' with args: {arguments}")
-            request_str = json.dumps(request) + "\n"
-            self.server_process.stdin.write(request_str)
-            self.server_process.stdin.flush()
-            
-            # Read response with timeout and proper error handling
-            import select
-            import sys
+            })
+            waiting.append((index, request_id, future))
+            logger.info("📤 MCP (AWS): Sending request to tool '%s' with args: %s", tool_name, arguments)
+        
+        if not requests:
+            return results
+        
+        try:
+            # The stdio server takes one message per line, so a batch is N frames in a single write
+            self._send_frames(requests)
             
-            # Check if data is available to read (with timeout)
-            if sys.platform == 'win32':
-                # Windows doesn't support select on pipes, so just try to read
+            # Each call keeps the single-call budget; the server answers pipelined calls in turn
+            deadline = time.monotonic() + TOOL_CALL_TIMEOUT_SECONDS * len(waiting)
+            for index, request_id, future in waiting:
                 try:
-                    response_str = self.server_process.stdout.readline()
-                except Exception as read_error:
-                    logger.error(f"📥 MCP (AWS): Failed to read response: {read_error}")
-                    return None
-            else:
-                # Unix-like systems can use select (Elastic Beanstalk uses Linux)
-                ready, _, _ = select.select([self.server_process.stdout], [], [], 5.0)
-                if not ready:
+                    response = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeoutError:
                     logger.error("📥 MCP (AWS): Timeout waiting for server response")
-                    return None
-                response_str = self.server_process.stdout.readline()
-            
-            if response_str:
-                logger.info(f"📥 MCP (AWS): Received response: {response_str.strip()[:200]}...")
-                try:
-                    response = json.loads(response_str)
-                    if "error" in response:
-                        logger.error(f"🚫 MCP (AWS): Server returned error: {response['error']}")
-                        return None
-                    
-                    if "result" in response:
-                        result = response["result"]
-                        if isinstance(result, dict) and "content" in result:
-                            content = result["content"]
-                        elif isinstance(result, list):
-                            content = result
-                        else:
-                            content = [result] if result else []
-                        
-                        logger.info(f"✅ MCP (AWS): Tool call successful, got {len(content) if isinstance(content, list) else 1} items")
-                        return content
-                    else:
-                        logger.warning("⚠️ MCP (AWS): No result in response")
-                        return []
-                except json.JSONDecodeError as json_error:
-                    logger.error(f"📥 MCP (AWS): Invalid JSON response: {json_error}")
-                    return None
-            else:
-                logger.error("📥 MCP (AWS): Empty response from server")
-                return None
+                    continue
+                
+                content = self._content_from_response(response)
+                if cache_keys[index] is not None and _is_cacheable_result(response, content):
+                    with self._cache_lock:
+                        self._tool_cache[cache_keys[index]] = copy.deepcopy(content)
+                        if len(self._tool_cache) > TOOL_CACHE_SIZE:
+                            self._tool_cache.popitem(last=False)
+                results[index] = content
             
         except Exception as e:
             logger.error(f"💥 MCP (AWS): Tool call failed: {e}")
             if self.server_process and self.server_process.poll() is not None:
                 logger.error(f"💀 MCP (AWS): Server process died with return code: {self.server_process.returncode}")
+        finally:
+            with self._pending_lock:
+                for _, request_id, _ in waiting:
+                    pending.pop(request_id, None)
+        
+        # The server died under these calls: respawn it and retry what failed, once
+        if _retry and self.server_process and self.server_process.poll() is not None:
+            failed = [index for index, _, _ in waiting if results[index] is None]
+            if failed and self._restart_server():
+                retried = self.call_tool_batch([calls[index] for index in failed], _retry=False)
+                for index, content in zip(failed, retried):
+                    results[index] = content
+        
+        return results
+    
+    def _restart_server(self) -> bool:
+        """Respawn an exited server process, unless restarts keep failing"""
+        with self._restart_lock:
+            if self.server_process and self.server_process.poll() is None:
+                return True  # Another caller already restarted it
+            
+            now = time.monotonic()
+            self._restart_failures = [t for t in self._restart_failures if now - t < RESTART_WINDOW_SECONDS]
+            if len(self._restart_failures) >= MAX_RESTART_FAILURES:
+                logger.error(f"🚫 MCP (AWS): {len(self._restart_failures)} restarts failed in the last {RESTART_WINDOW_SECONDS}s, not restarting")
+                return False
+            
+            returncode = self.server_process.returncode if self.server_process else None
+            logger.warning(f"🔄 MCP (AWS): Server process exited with code {returncode}, restarting...")
+            self.stop_server()
+            if self.start_server():
+                self._restart_failures.clear()
+                return True
+            
+            # Keep the failed process as a dead handle so later calls go through the breaker again
+            self._restart_failures.append(now)
+            if self.server_process:
+                try:
+                    self.server_process.kill()
+                    self.server_process.wait(timeout=5)
+                except Exception as kill_error:
+                    logger.debug(f"MCP (AWS): Could not kill failed server: {kill_error}")
+            logger.error("💥 MCP (AWS): Server restart failed")
+            return False
+    
+    def _content_from_response(self, response: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Extract the content list from a tools/call response"""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📥 MCP (AWS): Received response: %s...", str(response)[:200])
+        if "error" in response:
+            logger.error(f"🚫 MCP (AWS): Server returned error: {response['error']}")
             return None
+        
+        if "result" in response:
+            result = response["result"]
+            if isinstance(result, dict) and "content" in result:
+                content = result["content"]
+            elif isinstance(result, list):
+                content = result
+            else:
+                content = [result] if result else []
+            
+            logger.info("✅ MCP (AWS): Tool call successful, got %d items", len(content) if isinstance(content, list) else 1)
+            return content
+        else:
+            logger.warning("⚠️ MCP (AWS): No result in response")
+            return []
     
     # All the same methods as local_client.py but with AWS logging
     def search_materials(self, formula: str) -> List[str]:
         """Search materials by formula"""
-        logger.info(f"🔍 MCP (AWS): Searching materials for formula: {formula}")
+        logger.info("🔍 MCP (AWS): Searching materials for formula: %s", formula)
         
         result = self.call_tool("search_materials_by_formula", {
             "chemical_formula": formula
@@ -241,14 +559,14 @@ class EnhancedMCPClient:
                 
                 materials.append(text)
             
-            logger.info(f"✅ MCP (AWS): Found {len(materials)} materials for {formula}")
+            logger.info("✅ MCP (AWS): Found %d materials for %s", len(materials), formula)
             return materials
         logger.warning(f"❌ MCP (AWS): No materials found for {formula}")
         return []
     
-    def get_material_by_id(self, material_id: str, search_results: List[str] = None) -> Optional[Dict[str, Any]]:
+    def get_material_by_id(self, material_id: str, search_results: List[str] = None, fetch_geometry: bool = True) -> Optional[Dict[str, Any]]:
         """Get material by ID with structured data for base model"""
-        logger.info(f"🔍 MCP (AWS): Getting material data for ID")
+        logger.info("🔍 MCP (AWS): Getting material data for ID")
         
         result = self.call_tool("select_material_by_id", {
             "material_id": material_id
@@ -261,25 +579,26 @@ class EnhancedMCPClient:
             # Parse description to extract structured data
             data = self._parse_material_description_client(description, material_id, structure_uri, search_results)
             
-            # Get POSCAR geometry if available
-            poscar_data = self.get_structure_data(structure_uri, "poscar")
-            if poscar_data:
-                data["geometry"] = self._poscar_to_geometry(poscar_data)
+            # Get POSCAR geometry if available; callers that only need the URI skip this round trip
+            if fetch_geometry:
+                self.ensure_geometry(data)
             
-            logger.info(f"✅ MCP (AWS): Retrieved structured material data")
+            logger.info("✅ MCP (AWS): Retrieved structured material data")
             return data
         logger.warning(f"❌ MCP (AWS): Material not found")
         return None
     
+    def ensure_geometry(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach POSCAR-derived geometry to material data if it isn't there yet"""
+        if "geometry" not in data and data.get("structure_uri"):
+            poscar_data = self.get_structure_data(data["structure_uri"], "poscar")
+            if poscar_data:
+                data["geometry"] = _poscar_to_geometry(poscar_data)
+        return data
+    
     def _parse_material_description_client(self, description: str, material_id: str, structure_uri: str, search_results: List[str] = None) -> Dict[str, Any]:
         """Parse material description into structured data"""
-        logger.info(f"🔍 MCP (AWS): Parsing material description ({len(description)} chars)")
-        
-        data = {
-            "material_id": material_id,
-            "structure_uri": structure_uri,
-            "source": "MCP Materials Project Server (AWS)"
-        }
+        logger.info("🔍 MCP (AWS): Parsing material description (%d chars)", len(description))
         
         # Extract data using same logic as local_client
         search_data = None
@@ -289,97 +608,25 @@ class EnhancedMCPClient:
                     search_data = result
                     break
         
-        # Extract formula
-        formula = None
-        if search_data:
-            formula_match = re.search(r"Formula: ([^\n]+)", search_data)
-            if formula_match:
-                formula = formula_match.group(1).strip()
-        if not formula:
-            formula_match = re.search(r"Formula: ([^\n]+)", description)
-            if formula_match:
-                formula = formula_match.group(1).strip()
-        
-        if formula:
-            data["formula"] = formula
-        
-        # Extract band gap
-        band_gap = None
-        if search_data:
-            bg_match = re.search(r"Band Gap: ([\d\.]+)", search_data)
-            if bg_match:
-                band_gap = float(bg_match.group(1))
-        if band_gap is None:
-            bg_match = re.search(r"Band Gap: ([\d\.]+)", description)
-            if bg_match:
-                band_gap = float(bg_match.group(1))
-        
-        data["band_gap"] = band_gap if band_gap is not None else 0.0
-        
-        # Extract formation energy
-        formation_energy = None
-        if search_data:
-            fe_match = re.search(r"Formation Energy: ([\-\d\.]+)", search_data)
-            if fe_match:
-                formation_energy = float(fe_match.group(1))
-        if formation_energy is None:
-            fe_match = re.search(r"Formation Energy: ([\-\d\.]+)", description)
-            if fe_match:
-                formation_energy = float(fe_match.group(1))
+        parse_key = (material_id, structure_uri, description, search_data)
+        with self._cache_lock:
+            parsed = self._parsed_cache.get(parse_key)
+        if parsed is not None:
+            return dict(parsed)
         
-        data["formation_energy"] = formation_energy if formation_energy is not None else -3.0
+        data = _parse_material_description(description, material_id, structure_uri, search_data)
         
-        # Extract crystal system
-        crystal_system = None
-        if search_data:
-            cs_match = re.search(r"Crystal System: ([^\n]+)", search_data)
-            if cs_match:
-                crystal_system = cs_match.group(1).strip()
-        if not crystal_system:
-            cs_match = re.search(r"Crystal System: ([^\n]+)", description)
-            if cs_match:
-                crystal_system = cs_match.group(1).strip()
-        
-        if crystal_system:
-            data["crystal_system"] = crystal_system
-            logger.info(f"✅ MCP (AWS): Crystal system found for material")
+        if "crystal_system" in data:
+            logger.info("✅ MCP (AWS): Crystal system found for material")
         else:
-            logger.warning(f"❌ MCP (AWS): No crystal system found for material")
+            logger.warning("❌ MCP (AWS): No crystal system found for material")
         
+        with self._cache_lock:
+            self._parsed_cache[parse_key] = dict(data)
+            if len(self._parsed_cache) > TOOL_CACHE_SIZE:
+                self._parsed_cache.popitem(last=False)
         return data
     
-    def _poscar_to_geometry(self, poscar_str: str) -> str:
-        """Convert POSCAR to proper geometry string with element symbols"""
-        try:
-            lines = poscar_str.strip().split('\n')
-            if len(lines) < 8:
-                return ""
-            
-            # Extract element symbols from POSCAR
-            element_line = None
-            for i, line in enumerate(lines[:7]):
-                if re.match(r'^[A-Z][a-z]?(?:\s+[A-Z][a-z]?)*$', line.strip()):
-                    element_line = line.strip().split()
-                    break
-            
-            if not element_line:
-                element_line = ["Si"]
-            
-            # Extract coordinates and map to elements
-            atoms = []
-            coord_start = 8
-            for i, line in enumerate(lines[coord_start:coord_start+4]):
-                if line.strip():
-                    coords = line.strip().split()
-                    if len(coords) >= 3:
-                        element = element_line[i % len(element_line)]
-                        x, y, z = float(coords[0]) * 5.43, float(coords[1]) * 5.43, float(coords[2]) * 5.43
-                        atoms.append(f"{element} {x:.3f} {y:.3f} {z:.3f}")
-            
-            return "; ".join(atoms) if atoms else "Si 0.0 0.0 0.0; Si 1.932 1.932 1.932"
-        except Exception:
-            return "Si 0.0 0.0 0.0; Si 1.932 1.932 1.932"
-    
     # Additional MCP server tools (same as local_client)
     def get_structure_data(self, structure_uri: str, format: str = "poscar") -> Optional[str]:
         """Get structure data in POSCAR/CIF format"""
@@ -426,11 +673,33 @@ class EnhancedMCPClient:
             "structure_uri": structure_uri,
             "duplication": duplication
         })
-        if result:
-            for item in result:
-                if item.get("type") == "image":
-                    return item.get("data", "")
-        return None
+        # The server returns the image as the first item, so this normally stops at index 0
+        item = next((i for i in result or () if isinstance(i, dict) and i.get("type") == "image"), None)
+        if item is None:
+            return None
+        if item.get("path"):
+            return self._read_image_file(item["path"])
+        return item.get("data", "")
+    
+    @staticmethod
+    def _read_image_file(path: str) -> Optional[str]:
+        """Load a plot the server handed over as a file and return it as base64"""
+        path = os.path.realpath(path)
+        if os.path.dirname(path) != _IMAGE_DIR:
+            logger.error("🚫 MCP (AWS): Ignoring image path outside the image directory")
+            return None
+        try:
+            with open(path, 'rb') as image_file:
+                img_bytes = image_file.read()
+        except OSError as e:
+            logger.error(f"📥 MCP (AWS): Could not read plot image: {e}")
+            return None
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        return base64.b64encode(img_bytes).decode('utf-8')
     
     def build_supercell(self, bulk_structure_uri: str, supercell_parameters: Dict[str, Any]) -> Optional[Dict[str, str]]:
         """Build supercell from bulk structure"""
@@ -453,12 +722,32 @@ class EnhancedMCPClient:
 class EnhancedMCPAgent:
     """Enhanced MCP agent with full Materials Project server capabilities (AWS version)"""
     
+    # Resolved on first use; None when utils.material_selector isn't deployed
+    _select_best_material_match = None
+    _selector_lookup_done = False
+    
     def __init__(self, api_key: str):
+        # The server subprocess is started on first use, not at construction
         self.client = EnhancedMCPClient(api_key)
-        self.client.start_server()
+        self._start_lock = threading.Lock()
+    
+    def start(self) -> bool:
+        """Start the MCP server now instead of on the first tool call"""
+        return self._ensure_started()
+    
+    def _ensure_started(self) -> bool:
+        """Start the MCP server if it isn't running yet"""
+        if self.client.server_process is not None:
+            return True
+        with self._start_lock:
+            if self.client.server_process is None:
+                logger.info("🚀 MCP AGENT (AWS): Starting MCP server on first use")
+                return self.client.start_server()
+        return True
     
     def search(self, query: str) -> Dict[str, Any]:
         """Search for materials - returns structured data for base model"""
+        self._ensure_started()
         logger.info(f"🚀 MCP AGENT (AWS): Starting search for query: '{query}'")
         try:
             # Handle material ID queries
@@ -499,8 +788,8 @@ class EnhancedMCPAgent:
                     return result
                 else:
                     # Try to use smart material selection if available
-                    try:
-                        from utils.material_selector import select_best_material_match
+                    select_best_material_match = self._material_selector()
+                    if select_best_material_match:
                         best_material_id = select_best_material_match(results, query)
                         if best_material_id:
                             material_data = self.client.get_material_by_id(best_material_id, results)
@@ -509,8 +798,6 @@ class EnhancedMCPAgent:
                                 material_data["search_count"] = len(results)
                                 logger.info(f"✅ MCP AGENT (AWS): Found structured data for {query} via {best_material_id} (smart selection)")
                                 return material_data
-                    except ImportError:
-                        logger.info("Material selector not available in AWS environment, using basic selection")
                 
                 # Fallback to basic result format
                 result = {
@@ -529,40 +816,60 @@ class EnhancedMCPAgent:
             logger.error(f"💥 MCP AGENT (AWS): Search failed for '{query}': {e}")
             return {"error": str(e)}
     
+    @classmethod
+    def _material_selector(cls):
+        """Return select_best_material_match, importing it only on the first call"""
+        if not cls._selector_lookup_done:
+            try:
+                from utils.material_selector import select_best_material_match
+                cls._select_best_material_match = staticmethod(select_best_material_match)
+            except ImportError:
+                logger.info("Material selector not available in AWS environment, using basic selection")
+            cls._selector_lookup_done = True
+        return cls._select_best_material_match
+    
     # All MCP server tools exposed through agent (same as local version)
     def get_structure(self, material_id: str, format: str = "poscar") -> Optional[str]:
         """Get structure in POSCAR/CIF format"""
-        material_data = self.client.get_material_by_id(material_id)
+        self._ensure_started()
+        material_data = self.client.get_material_by_id(material_id, fetch_geometry=False)
         if material_data and material_data.get("structure_uri"):
             return self.client.get_structure_data(material_data["structure_uri"], format)
         return None
     
     def get_structure_data(self, structure_uri: str, format: str = "poscar") -> Optional[str]:
         """Get structure data by URI"""
+        self._ensure_started()
         return self.client.get_structure_data(structure_uri, format)
     
     def create_structure_from_poscar(self, poscar_str: str) -> Optional[Dict[str, str]]:
         """Create structure from POSCAR string"""
+        self._ensure_started()
         return self.client.create_structure_from_poscar(poscar_str)
     
     def create_structure_from_cif(self, cif_str: str) -> Optional[Dict[str, str]]:
         """Create structure from CIF string"""
+        self._ensure_started()
         return self.client.create_structure_from_cif(cif_str)
     
     def plot_structure(self, structure_uri: str, duplication: List[int] = [1, 1, 1]) -> Optional[str]:
         """Plot structure and return base64 image"""
+        self._ensure_started()
         return self.client.plot_structure(structure_uri, duplication)
     
     def build_supercell(self, bulk_structure_uri: str, supercell_parameters: Dict[str, Any]) -> Optional[Dict[str, str]]:
         """Build supercell from bulk structure"""
+        self._ensure_started()
         return self.client.build_supercell(bulk_structure_uri, supercell_parameters)
     
     def search_materials_by_formula(self, formula: str) -> List[str]:
         """Direct access to formula search"""
+        self._ensure_started()
         return self.client.search_materials(formula)
     
     def select_material_by_id(self, material_id: str) -> Optional[Dict[str, Any]]:
         """Select material by ID using MCP server tool"""
+        self._ensure_started()
         logger.info(f"🔍 MCP (AWS): Selecting material by ID: {material_id}")
         
         result = self.client.call_tool("select_material_by_id", {
@@ -574,12 +881,12 @@ class EnhancedMCPAgent:
             structure_uri = result[1].get("text", "").replace("structure uri: ", "") if isinstance(result[1], dict) else str(result[1]).replace("structure uri: ", "")
             
             # Parse description to extract structured data
-            data = self._parse_material_description(description, material_id, structure_uri)
+            data = _parse_material_description(description, material_id, structure_uri, source="Enhanced MCP Server (AWS)")
             
             # Get POSCAR geometry if available
             poscar_data = self.get_structure_data(structure_uri, "poscar")
             if poscar_data:
-                data["geometry"] = self._poscar_to_geometry(poscar_data)
+                data["geometry"] = _poscar_to_geometry(poscar_data)
             
             logger.info(f"✅ MCP (AWS): Material selected: {material_id}")
             return data
@@ -587,76 +894,9 @@ class EnhancedMCPAgent:
         logger.warning(f"❌ MCP (AWS): Material {material_id} not found")
         return None
     
-    def _parse_material_description(self, description: str, material_id: str, structure_uri: str) -> Dict[str, Any]:
-        """Parse material description into structured data"""
-        import re
-        
-        data = {
-            "material_id": material_id,
-            "structure_uri": structure_uri,
-            "source": "Enhanced MCP Server (AWS)"
-        }
-        
-        # Extract formula
-        formula_match = re.search(r"Formula: ([^\n]+)", description)
-        if formula_match:
-            data["formula"] = formula_match.group(1).strip()
-        
-        # Extract band gap
-        bg_match = re.search(r"Band Gap: ([\d\.]+)", description)
-        if bg_match:
-            data["band_gap"] = float(bg_match.group(1))
-        else:
-            data["band_gap"] = 0.0
-        
-        # Extract formation energy
-        fe_match = re.search(r"Formation Energy: ([\-\d\.]+)", description)
-        if fe_match:
-            data["formation_energy"] = float(fe_match.group(1))
-        else:
-            data["formation_energy"] = -3.0
-        
-        # Extract crystal system
-        cs_match = re.search(r"Crystal System: ([^\n]+)", description)
-        if cs_match:
-            data["crystal_system"] = cs_match.group(1).strip()
-        
-        return data
-    
-    def _poscar_to_geometry(self, poscar_str: str) -> str:
-        """Convert POSCAR to geometry string"""
-        try:
-            lines = poscar_str.strip().split('\n')
-            if len(lines) < 8:
-                return ""
-            
-            # Extract element symbols
-            element_line = None
-            for i, line in enumerate(lines[:7]):
-                if re.match(r'^[A-Z][a-z]?(?:\s+[A-Z][a-z]?)*$', line.strip()):
-                    element_line = line.strip().split()
-                    break
-            
-            if not element_line:
-                element_line = ["Si"]
-            
-            # Extract coordinates
-            atoms = []
-            coord_start = 8
-            for i, line in enumerate(lines[coord_start:coord_start+4]):
-                if line.strip():
-                    coords = line.strip().split()
-                    if len(coords) >= 3:
-                        element = element_line[i % len(element_line)]
-                        x, y, z = float(coords[0]) * 5.43, float(coords[1]) * 5.43, float(coords[2]) * 5.43
-                        atoms.append(f"{element} {x:.3f} {y:.3f} {z:.3f}")
-            
-            return "; ".join(atoms) if atoms else "Si 0.0 0.0 0.0; Si 1.932 1.932 1.932"
-        except Exception:
-            return "Si 0.0 0.0 0.0; Si 1.932 1.932 1.932"
-    
     def moire_homobilayer(self, bulk_structure_uri: str, interlayer_spacing: float, max_num_atoms: int, twist_angle: float, vacuum_thickness: float) -> Optional[Dict[str, str]]:
         """Generate moire homobilayer structure"""
+        self._ensure_started()
         logger.info(f"🔍 MCP (AWS): Generating moire homobilayer for {bulk_structure_uri}")
         
         result = self.client.call_tool("moire_homobilayer", {
@@ -672,7 +912,7 @@ class EnhancedMCPAgent:
             text = first_item.get("text", "") if isinstance(first_item, dict) else str(first_item)
             
             if "Moire structure is created" in text:
-                uri_match = re.search(r"structure://([a-f0-9]+)", text)
+                uri_match = _RE_MOIRE_URI.search(text)
                 moire_uri = uri_match.group(0) if uri_match else "structure://unknown"
                 
                 data = {
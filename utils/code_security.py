@@ -8,56 +8,64 @@ from typing import List, Dict, Any
 class CodeSecurityValidator:
     """Validates generated code for security risks"""
     
-    DANGEROUS_IMPORTS = {
+    DANGEROUS_IMPORTS = frozenset({
         'os', 'subprocess', 'sys', 'eval', 'exec', 'compile',
         'open', '__import__', 'globals', 'locals', 'vars',
         'getattr', 'setattr', 'delattr', 'hasattr'
-    }
+    })
     
-    DANGEROUS_FUNCTIONS = {
+    DANGEROUS_FUNCTIONS = frozenset({
         'eval', 'exec', 'compile', 'input', 'raw_input',
         'file', 'execfile', 'reload', '__import__'
-    }
+    })
+    
+    NETWORK_PATTERNS = ('urllib', 'requests', 'socket', 'http', 'ftp', 'smtp', 'telnet')
     
     @classmethod
     def validate_code_safety(cls, code: str) -> Dict[str, Any]:
         """Validate code for security risks without execution"""
+        try:
+            tree = ast.parse(code)
+        except (SyntaxError, ValueError):
+            # Snippets that don't parse (partial code, markdown) get the textual scan
+            issues = cls._scan_source_text(code)
+        else:
+            visitor = _SecurityVisitor(cls)
+            visitor.visit(tree)
+            issues = list(visitor.issues)
+        
+        return {
+            'is_safe': len(issues) == 0,
+            'issues': issues,
+            'risk_level': 'HIGH' if issues else 'LOW'
+        }
+    
+    @classmethod
+    def _scan_source_text(cls, code: str) -> List[str]:
+        """Regex/substring scan used when the code cannot be parsed"""
         issues = []
         
         # Check for dangerous imports
-        import_pattern = r'(?:from\s+(\w+)|import\s+(\w+))'
-        imports = re.findall(import_pattern, code, re.IGNORECASE)
-        
-        for imp in imports:
+        for imp in _IMPORT_RE.findall(code):
             module = imp[0] or imp[1]
-            if module.lower() in cls.DANGEROUS_IMPORTS:
+            if module in cls.DANGEROUS_IMPORTS:
                 issues.append(f"Dangerous import detected: {module}")
         
         # Check for dangerous function calls
-        for func in cls.DANGEROUS_FUNCTIONS:
-            if re.search(rf'\b{func}\s*\(', code, re.IGNORECASE):
-                issues.append(f"Dangerous function call: {func}")
+        for func in dict.fromkeys(_DANGEROUS_CALL_RE.findall(code)):
+            issues.append(f"Dangerous function call: {func}")
         
-        # Check for file operations
-        file_ops = ['open(', 'file(', 'with open']
-        for op in file_ops:
-            if op in code.lower():
-                issues.append(f"File operation detected: {op}")
+        # Check for file and network operations in one pass over the code
+        file_ops, network_ops = {}, {}
+        for match in _BAD_OPS_RE.finditer(code):
+            if match.lastgroup == 'net':
+                network_ops.setdefault(match.group().lower(), None)
+            else:
+                file_ops.setdefault(_FILE_OP_LABELS[match.lastgroup], None)
+        issues.extend(f"File operation detected: {op}" for op in file_ops)
+        issues.extend(f"Network operation detected: {pattern}" for pattern in network_ops)
         
-        # Check for network operations
-        network_patterns = [
-            r'urllib', r'requests', r'socket', r'http',
-            r'ftp', r'smtp', r'telnet'
-        ]
-        for pattern in network_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
-                issues.append(f"Network operation detected: {pattern}")
-        
-        return {
-            'is_safe': len(issues) == 0,
-            'issues': issues,
-            'risk_level': 'HIGH' if issues else 'LOW'
-        }
+        return issues
     
     @classmethod
     def sanitize_code_display(cls, code: str) -> str:
@@ -100,6 +108,85 @@ class CodeSecurityValidator:
 - Use containerized execution when possible
 """
 
+class _SecurityVisitor(ast.NodeVisitor):
+    """Single AST pass covering the textual scan's checks, string literals and imported names"""
+    
+    def __init__(self, validator):
+        self.validator = validator
+        self.issues = {}  # insertion-ordered set of messages
+    
+    def _flag(self, message: str):
+        self.issues.setdefault(message, None)
+    
+    def _check_module(self, module: str):
+        if module.split('.')[0] in self.validator.DANGEROUS_IMPORTS:
+            self._flag(f"Dangerous import detected: {module.split('.')[0]}")
+        for pattern in self.validator.NETWORK_PATTERNS:
+            if pattern in module:
+                self._flag(f"Network operation detected: {pattern}")
+    
+    def visit_Import(self, node):
+        for alias in node.names:
+            self._check_module(alias.name)
+        self.generic_visit(node)
+    
+    def visit_ImportFrom(self, node):
+        if node.module:
+            self._check_module(node.module)
+        # "from builtins import open as o" hides the call from visit_Call, so flag the name itself
+        for alias in node.names:
+            if alias.name in self.validator.DANGEROUS_IMPORTS or alias.name in self.validator.DANGEROUS_FUNCTIONS:
+                self._flag(f"Dangerous import detected: {alias.name}")
+        self.generic_visit(node)
+    
+    def visit_With(self, node):
+        for item in node.items:
+            expr = item.context_expr
+            if isinstance(expr, ast.Call) and _call_name(expr) == 'open':
+                self._flag("File operation detected: with open")
+        self.generic_visit(node)
+    
+    visit_AsyncWith = visit_With
+    
+    def visit_Call(self, node):
+        name = _call_name(node)
+        if name in self.validator.DANGEROUS_FUNCTIONS:
+            self._flag(f"Dangerous function call: {name}")
+        if name in ('open', 'file'):
+            self._flag(f"File operation detected: {name}(")
+        self.generic_visit(node)
+    
+    def visit_Constant(self, node):
+        # URLs and endpoints can reach any allowed helper, so string literals are scanned too
+        if isinstance(node.value, str):
+            for match in _NETWORK_RE.finditer(node.value):
+                self._flag(f"Network operation detected: {match.group().lower()}")
+
+
+# Patterns for the textual fallback scan, compiled once
+# Keywords and identifiers are case-sensitive, so these two need no IGNORECASE or lowering
+_IMPORT_RE = re.compile(r'(?:from\s+(\w+)|import\s+(\w+))')
+_DANGEROUS_CALL_RE = re.compile(
+    r'\b(' + '|'.join(sorted(CodeSecurityValidator.DANGEROUS_FUNCTIONS)) + r')\s*\('
+)
+# "with " only looks ahead at open, so the following open( is still reported on its own
+_BAD_OPS_RE = re.compile(
+    r'(?P<with_open>\bwith\s+(?=open\b))|(?P<open>\bopen\s*\()|(?P<file>\bfile\s*\()'
+    r'|(?P<net>' + '|'.join(CodeSecurityValidator.NETWORK_PATTERNS) + r')',
+    re.IGNORECASE
+)
+_FILE_OP_LABELS = {'with_open': 'with open', 'open': 'open(', 'file': 'file('}
+_NETWORK_RE = re.compile('|'.join(CodeSecurityValidator.NETWORK_PATTERNS), re.IGNORECASE)
+
+def _call_name(node: ast.Call) -> str:
+    """Called name for f(...) and obj.f(...), '' for anything else"""
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return ''
+
 def validate_generated_code(code: str) -> Dict[str, Any]:
     """Main function to validate generated code"""
     return CodeSecurityValidator.validate_code_safety(code)
@@ -4,14 +4,24 @@ Validates credentials and configuration at startup
 """
 import os
 import logging
-import boto3
 import re
+import string
+from functools import lru_cache
 from pathlib import Path
-from botocore.exceptions import ClientError
 from typing import Dict, Optional, List
 
 logger = logging.getLogger(__name__)
 
+# Parameter Store names for the Cognito settings
+COGNITO_POOL_ID_PARAM = '/quantum-matter/cognito/pool-id'
+COGNITO_CLIENT_ID_PARAM = '/quantum-matter/cognito/client-id'
+COGNITO_CLIENT_SECRET_PARAM = '/quantum-matter/cognito/client-secret'
+
+# Input checks, built once at import
+_PYPATH_CHARS = frozenset(string.ascii_letters + string.digits + '._/\\:-')
+_FORMULA_RE = re.compile(r'^[A-Za-z0-9\-\(\)\s]+$')
+_QUERY_TAG_RE = re.compile(r'<[^>]{0,200}>')
+
 class ConfigurationError(Exception):
     """Raised when configuration validation fails"""
     pass
@@ -42,14 +52,20 @@ def validate_cognito_config() -> Dict[str, str]:
         if not all([pool_id, client_id, client_secret]):
             logger.info("Cognito config not in environment, checking Parameter Store...")
             try:
+                import boto3  # only needed when falling back to Parameter Store
                 ssm = boto3.client('ssm')
                 
-                if not pool_id:
-                    pool_id = _get_parameter(ssm, '/quantum-matter/cognito/pool-id')
-                if not client_id:
-                    client_id = _get_parameter(ssm, '/quantum-matter/cognito/client-id')
-                if not client_secret:
-                    client_secret = _get_parameter(ssm, '/quantum-matter/cognito/client-secret')
+                # Fetch every missing value in a single GetParameters round trip
+                wanted = [name for name, value in (
+                    (COGNITO_POOL_ID_PARAM, pool_id),
+                    (COGNITO_CLIENT_ID_PARAM, client_id),
+                    (COGNITO_CLIENT_SECRET_PARAM, client_secret),
+                ) if not value]
+                fetched = _get_parameters(ssm, wanted)
+                
+                pool_id = pool_id or fetched.get(COGNITO_POOL_ID_PARAM)
+                client_id = client_id or fetched.get(COGNITO_CLIENT_ID_PARAM)
+                client_secret = client_secret or fetched.get(COGNITO_CLIENT_SECRET_PARAM)
                     
             except Exception as e:
                 logger.error(f"Failed to retrieve from Parameter Store: {e}")
@@ -79,8 +95,28 @@ def validate_cognito_config() -> Dict[str, str]:
     
     return config
 
+def _get_parameters(ssm_client, parameter_names: List[str]) -> Dict[str, str]:
+    """Get several parameters from Parameter Store in one call, keyed by name"""
+    from botocore.exceptions import ClientError
+    
+    if not parameter_names:
+        return {}
+    try:
+        response = ssm_client.get_parameters(Names=parameter_names, WithDecryption=True)
+    except ClientError as e:
+        # e.g. a policy that allows ssm:GetParameter but not ssm:GetParameters
+        logger.warning(f"Batch parameter lookup failed, fetching individually: {e}")
+        values = {name: _get_parameter(ssm_client, name) for name in parameter_names}
+        return {name: value for name, value in values.items() if value is not None}
+    
+    for name in response.get('InvalidParameters', []):
+        logger.warning(f"Parameter {name} not found in Parameter Store")
+    return {param['Name']: param['Value'] for param in response.get('Parameters', [])}
+
 def _get_parameter(ssm_client, parameter_name: str) -> Optional[str]:
     """Get parameter from Systems Manager Parameter Store"""
+    from botocore.exceptions import ClientError
+    
     try:
         response = ssm_client.get_parameter(Name=parameter_name, WithDecryption=True)
         return response['Parameter']['Value']
@@ -104,16 +140,18 @@ def validate_python_executable(python_path: str) -> str:
     Raises:
         ConfigurationError: If Python executable is invalid
     """
-    import shutil
-    
     # Sanitize the path - only allow alphanumeric, dots, slashes, backslashes, hyphens, and colons
-    import re
-    if not re.match(r'^[a-zA-Z0-9._/\\:-]+$', python_path):
+    if not python_path or not python_path.isascii() or not all(c in _PYPATH_CHARS for c in python_path):
         raise ConfigurationError(f"Invalid Python executable path: {python_path}")
     
-    # Check if executable exists
-    if not shutil.which(python_path):
-        raise ConfigurationError(f"Python executable not found: {python_path}")
+    # Check if executable exists; only bare names like "python3" need a PATH search
+    if os.path.isabs(python_path):
+        if not (os.path.isfile(python_path) and os.access(python_path, os.X_OK)):
+            raise ConfigurationError(f"Python executable not found: {python_path}")
+    else:
+        import shutil
+        if not shutil.which(python_path):
+            raise ConfigurationError(f"Python executable not found: {python_path}")
     
     logger.info(f"✅ Python executable validated: {python_path}")
     return python_path
@@ -183,7 +221,7 @@ def validate_formula(formula: str) -> str:
         raise ValueError("Invalid formula length (max 100 characters)")
     
     # Allow chemical formulas: letters, numbers, hyphens, parentheses, spaces
-    if not re.match(r'^[A-Za-z0-9\-\(\)\s]+$', formula.strip()):
+    if not _FORMULA_RE.match(formula.strip()):
         raise ValueError("Invalid formula characters")
     
     return formula.strip()
@@ -193,22 +231,29 @@ def validate_query(query: str) -> str:
     if not query or len(query) > 5000:
         raise ValueError("Invalid query length (max 5000 characters)")
     
-    # Remove potential script tags and suspicious patterns
-    cleaned = re.sub(r'<[^>]{0,200}>', '', query)
-    if len(cleaned) != len(query):
+    # Reject potential script tags and suspicious patterns
+    if '<' in query and _QUERY_TAG_RE.search(query):
         raise ValueError("HTML/XML tags not allowed in queries")
     
     return query.strip()
 
+@lru_cache(maxsize=32)
+def _resolved_base(base_dir: str) -> Path:
+    """Resolved base directory, cached since callers validate many paths against the same base.
+    
+    base_dir must be absolute, so a later chdir cannot leave a stale entry behind.
+    """
+    return Path(base_dir).resolve()
+
 def validate_file_path(path: str, base_dir: str) -> Path:
     """Validate file path to prevent traversal attacks"""
     if not path or '..' in path or path.startswith('/'):
         raise ValueError("Invalid path format")
     
-    base_path = Path(base_dir).resolve()
+    base_path = _resolved_base(os.path.abspath(base_dir))
     resolved_path = (base_path / path).resolve()
     
-    if not str(resolved_path).startswith(str(base_path)):
+    if not resolved_path.is_relative_to(base_path):
         raise ValueError("Path traversal detected")
     
     return resolved_path
\ No newline at end of file